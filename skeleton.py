@@ -5,6 +5,49 @@ This module provides functions for tracking plant growth, nutrient levels,
 and environmental conditions using different file handling modes.
 """
 
+# Maximum number of (path, term, limit, offset) entries kept by cached_search_logs
+SEARCH_CACHE_SIZE = 128
+
+# Column schema of nutrient_levels.csv, in file order
+NUTRIENT_SCHEMA = {
+    "date": str,
+    "nitrogen": float,
+    "phosphorus": float,
+    "potassium": float,
+    "ec_level": float
+}
+
+# Window sizes (in readings) tracked by the rolling nutrient statistics
+NUTRIENT_STAT_WINDOWS = (7, 30)
+
+# Compression of the t-digest style quantile sketches kept in report aggregates;
+# higher values keep more centroids and give more accurate percentiles
+REPORT_SKETCH_SIZE = 100
+
+# Output formats supported by render_report and generate_report_outputs
+REPORT_FORMATS = ("text", "json", "csv", "html")
+
+# Size in bytes of each read/write when backup_data_files falls back to chunked copying
+BACKUP_CHUNK_SIZE = 1024 * 1024
+
+# Prefix put in front of the "Recipe: " header of a slot whose recipe has moved
+# (see convert_recipes_to_slots); blocks with this prefix are skipped by readers
+RECIPE_TOMBSTONE = "~"
+
+# Default (min, max) environmental bounds checked by check_alerts
+SENSOR_ALERT_BOUNDS = {
+    "temperature": (18.0, 30.0),
+    "humidity": (50.0, 85.0),
+    "light_level": (15000.0, 30000.0)
+}
+
+
+class RecipeConflictError(Exception):
+    """
+    Raised by update_recipe when a recipe is no longer at the expected version.
+    """
+
+
 def read_sensor_data(file_path="sensor_readings.txt"):
     """
     Reads sensor data from a file using read ('r') mode.
@@ -19,6 +62,20 @@ def read_sensor_data(file_path="sensor_readings.txt"):
     pass
 
 
+def iter_sensor_data(file_path="sensor_readings.txt"):
+    """
+    Lazily reads sensor data from a file using read ('r') mode, one line at a time.
+    
+    Args:
+        file_path (str): Path to the sensor readings file
+        
+    Yields:
+        dict: Sensor reading in the same format as read_sensor_data
+    """
+    # TODO: Implement iter sensor data generator
+    pass
+
+
 def save_daily_readings(data, file_path="sensor_readings.txt"):
     """
     Saves sensor readings to a file using write ('w') mode.
@@ -38,6 +95,7 @@ def save_daily_readings(data, file_path="sensor_readings.txt"):
 def log_system_event(event_type, message, file_path="system_log.txt"):
     """
     Logs a system event using append ('a') mode.
+    Also updates the per-bucket event counters in the "<file_path>.stats" sidecar.
     
     Args:
         event_type (str): Type of event
@@ -51,22 +109,254 @@ def log_system_event(event_type, message, file_path="system_log.txt"):
     pass
 
 
-def update_recipe(recipe_name, new_instructions, file_path="recipes.txt"):
+def log_system_events(events, file_path="system_log.txt"):
+    """
+    Logs a batch of system events with a single write using append ('a') mode.
+    Entries use the same format as log_system_event and update the same stats sidecar.
+    
+    Args:
+        events (list): List of (event_type, message) tuples
+        file_path (str): Path to the log file
+        
+    Returns:
+        bool: True if the events were logged successfully
+    """
+    # TODO: Implement log system events function
+    pass
+
+
+def log_event_stats(since=None, until=None, bucket="hour", file_path="system_log.txt"):
+    """
+    Returns event counts per event type per time bucket from the stats sidecar
+    using read ('r') mode, without reading the log file itself.
+    
+    Args:
+        since (str): Earliest timestamp to include ("%Y-%m-%d %H:%M:%S"), None for no bound
+        until (str): Latest timestamp to include ("%Y-%m-%d %H:%M:%S"), None for no bound
+        bucket (str): Bucket size: "hour" or "day"
+        file_path (str): Path to the log file
+        
+    Returns:
+        dict: Mapping of bucket start timestamp to a dictionary of event_type counts
+    """
+    # TODO: Implement log event stats function
+    pass
+
+
+def rebuild_log_event_stats(file_path="system_log.txt"):
+    """
+    Rebuilds the stats sidecar from scratch by reading the whole log file
+    using read ('r') mode and writing the counters using write ('w') mode.
+    
+    Args:
+        file_path (str): Path to the log file
+        
+    Returns:
+        bool: True if the stats were rebuilt successfully
+    """
+    # TODO: Implement rebuild log event stats function
+    pass
+
+
+def update_recipe(recipe_name, new_instructions, file_path="recipes.txt", expected_version=None):
     """
     Updates a nutrient recipe using read/write ('r+') mode.
+    Holds an exclusive fcntl lock on "<file_path>.lock" for the whole update and
+    bumps the recipe's version number stored in "<file_path>.versions".
+    Every change is also recorded in the recipe history (see get_recipe_as_of).
+    Seeks straight to the recipe block using the byte-span index from build_recipe_index.
+    In a slot layout (see convert_recipes_to_slots) instructions that fit the slot
+    overwrite only that block and are padded with spaces to the slot's end; larger
+    ones move the recipe to a new slot at the end of the file and tombstone the old
+    slot by prefixing its header with RECIPE_TOMBSTONE.
     
     Args:
         recipe_name (str): Name of the recipe to update
         new_instructions (str): New recipe instructions
         file_path (str): Path to the recipes file
+        expected_version (int): Only update if the recipe is still at this version (None to skip the check)
         
     Returns:
         bool: True if the recipe was updated successfully
+        
+    Raises:
+        RecipeConflictError: If expected_version does not match the current version
     """
     # TODO: Implement update recipe function
     pass
 
 
+def update_recipes(updates, file_path="recipes.txt"):
+    """
+    Updates many nutrient recipes in a single pass: streams the recipes file using
+    read ('r') mode, replaces every matching block, and writes the result to a
+    temporary file using write ('w') mode before atomically replacing the original.
+    A slot layout is kept: replaced blocks are padded to their slot size (or given a
+    larger slot, as in convert_recipes_to_slots, when they no longer fit) and
+    tombstoned slots are dropped.
+    Holds the same exclusive fcntl lock as update_recipe, bumps each updated
+    recipe's version and appends one history entry per updated recipe.
+    
+    Args:
+        updates (dict): Mapping of recipe name to new recipe instructions
+        file_path (str): Path to the recipes file
+        
+    Returns:
+        dict: Dictionary with "updated" and "not_found" lists of recipe names
+    """
+    # TODO: Implement update recipes function
+    pass
+
+
+def get_recipe_version(recipe_name, file_path="recipes.txt"):
+    """
+    Reads the current version number of a recipe from "<file_path>.versions"
+    using read ('r') mode under a shared fcntl lock on "<file_path>.lock".
+    
+    Args:
+        recipe_name (str): Name of the recipe
+        file_path (str): Path to the recipes file
+        
+    Returns:
+        int: Current version of the recipe (0 if it has never been updated), or None if the recipe is not found
+    """
+    # TODO: Implement get recipe version function
+    pass
+
+
+def read_recipes(file_path="recipes.txt"):
+    """
+    Reads and parses all recipes from the recipes file using read ('r') mode
+    under a shared fcntl lock on "<file_path>.lock". Tombstoned blocks (see
+    RECIPE_TOMBSTONE) are skipped and slot padding is ignored. Parsed recipes are
+    cached per file and reused until the file's modification time changes;
+    update_recipe refreshes the cache after writing.
+    
+    Args:
+        file_path (str): Path to the recipes file
+        
+    Returns:
+        list: List of dictionaries with keys "name", "nitrogen", "phosphorus",
+              "potassium" (float ppm values), "ec_range" and "ph_range" ((min, max) float tuples)
+    """
+    # TODO: Implement read recipes function
+    pass
+
+
+def get_recipe_as_of(recipe_name, timestamp, file_path="recipes.txt"):
+    """
+    Looks up the instructions a recipe had at a given time. Recipe changes are
+    appended by update_recipe and update_recipes to "<file_path>.history" using
+    append ('a') mode, one timestamped JSON line per change; "<file_path>.history.idx"
+    keeps the byte offsets of each recipe's entries so the lookup only reads the
+    matching lines. The first change of a recipe is preceded by a baseline entry
+    holding its previous instructions, stamped with the recipes file's modification
+    time before the change. Recipes with no history are read from the recipes file.
+    
+    Args:
+        recipe_name (str): Name of the recipe
+        timestamp (str): Point in time to look up ("%Y-%m-%d %H:%M:%S")
+        file_path (str): Path to the recipes file
+        
+    Returns:
+        str: Recipe instructions active at that time, or None if the recipe is unknown
+             or the time is before its baseline entry
+    """
+    # TODO: Implement get recipe as of function
+    pass
+
+
+def compact_recipe_history(file_path="recipes.txt", retention_days=90):
+    """
+    Rebuilds the current-state recipes file from the recipe history (entries from
+    both update_recipe and update_recipes) using write ('w') mode and prunes history
+    entries older than the retention window, always keeping the latest entry of
+    every recipe. Recipes that have no history entries are carried over unchanged
+    from the current recipes file. Holds the same exclusive lock as update_recipe.
+    
+    Args:
+        file_path (str): Path to the recipes file
+        retention_days (int): Number of days of history to keep
+        
+    Returns:
+        bool: True if the history was compacted successfully
+    """
+    # TODO: Implement compact recipe history function
+    pass
+
+
+def build_recipe_index(file_path="recipes.txt"):
+    """
+    Builds a byte-span index of the recipes file from its "Recipe: <name>" headers
+    using binary read ('rb') mode and stores it in "<file_path>.idx" together with
+    the file's size and modification time. A stored index whose size/mtime still
+    match the recipes file is reused instead of rescanning. Headers prefixed with
+    RECIPE_TOMBSTONE are not indexed, and in a slot layout each span covers the
+    whole slot, padding included.
+    
+    Args:
+        file_path (str): Path to the recipes file
+        
+    Returns:
+        dict: Mapping of recipe name to (start, end) byte offsets of its block
+    """
+    # TODO: Implement build recipe index function
+    pass
+
+
+def get_recipe(recipe_name, file_path="recipes.txt"):
+    """
+    Reads a single recipe by seeking to its block via the recipe index
+    using binary read ('rb') mode under a shared fcntl lock on "<file_path>.lock".
+    Slot padding is stripped from the returned instructions; tombstoned slots are
+    never found because build_recipe_index skips them.
+    
+    Args:
+        recipe_name (str): Name of the recipe to read
+        file_path (str): Path to the recipes file
+        
+    Returns:
+        str: Recipe instructions without the header, or None if the recipe is not found
+    """
+    # TODO: Implement get recipe function
+    pass
+
+
+def convert_recipes_to_slots(file_path="recipes.txt", slot_capacity=512):
+    """
+    Rewrites the recipes file using write ('w') mode so that each recipe block is
+    padded with spaces to a fixed slot capacity in bytes, allowing update_recipe
+    to overwrite recipes in place. A block larger than slot_capacity gets a slot
+    of the next multiple of slot_capacity, and tombstoned blocks are dropped.
+    
+    Args:
+        file_path (str): Path to the recipes file
+        slot_capacity (int): Minimum size in bytes of each recipe slot
+        
+    Returns:
+        bool: True if the recipes file was converted successfully
+    """
+    # TODO: Implement convert recipes to slots function
+    pass
+
+
+def compact_recipes(file_path="recipes.txt"):
+    """
+    Reclaims space left by tombstoned recipe slots (headers prefixed with
+    RECIPE_TOMBSTONE) by rewriting the live recipes, each in its current slot size,
+    to a temporary file using write ('w') mode and replacing the recipes file,
+    holding the same exclusive lock as update_recipe.
+    
+    Args:
+        file_path (str): Path to the recipes file
+        
+    Returns:
+        bool: True if the recipes file was compacted successfully
+    """
+    # TODO: Implement compact recipes function
+    pass
+
+
 def read_nutrient_levels(file_path="nutrient_levels.csv"):
     """
     Reads nutrient level data from a CSV file using read ('r') mode.
@@ -81,13 +371,48 @@ def read_nutrient_levels(file_path="nutrient_levels.csv"):
     pass
 
 
-def append_nutrient_reading(reading, file_path="nutrient_levels.csv"):
+def iter_nutrient_levels(file_path="nutrient_levels.csv"):
+    """
+    Lazily reads nutrient level data from a CSV file using read ('r') mode, one row at a time.
+    
+    Args:
+        file_path (str): Path to the nutrient levels file
+        
+    Yields:
+        dict: Nutrient reading in the same format as read_nutrient_levels
+    """
+    # TODO: Implement iter nutrient levels generator
+    pass
+
+
+def read_nutrient_columns(file_path="nutrient_levels.csv", schema=None, as_numpy=False):
+    """
+    Reads nutrient level data from a CSV file column by column using read ('r') mode
+    and converts each column once according to the schema. Cells that cannot be
+    converted are stored as NaN and reported instead of being dropped.
+    
+    Args:
+        file_path (str): Path to the nutrient levels file
+        schema (dict): Mapping of column name to type (defaults to NUTRIENT_SCHEMA)
+        as_numpy (bool): Return NumPy arrays instead of lists (requires NumPy)
+        
+    Returns:
+        dict: Dictionary with "columns" (column name to list or array of values) and
+              "errors" (list of (line_number, column, value) tuples for invalid cells)
+    """
+    # TODO: Implement read nutrient columns function
+    pass
+
+
+def append_nutrient_reading(reading, file_path="nutrient_levels.csv", store_dir=None):
     """
     Appends a new nutrient reading to the CSV file using append ('a') mode.
+    Also updates the rolling statistics kept in "<file_path>.rolling" (see nutrient_stats).
     
     Args:
         reading (dict): Dictionary containing nutrient reading data
         file_path (str): Path to the nutrient levels file
+        store_dir (str): Columnar store directory to also append to (None to skip, see read_nutrient_store)
         
     Returns:
         bool: True if the reading was appended successfully
@@ -96,13 +421,203 @@ def append_nutrient_reading(reading, file_path="nutrient_levels.csv"):
     pass
 
 
-def generate_weekly_report(data_file_path, output_file_path="weekly_report.txt"):
+def append_nutrient_readings(readings, file_path="nutrient_levels.csv"):
+    """
+    Appends a batch of nutrient readings to the CSV file using append ('a') mode
+    with a single csv writer call. The header is written if the file is new and
+    otherwise validated against the expected field order once. The result of that
+    check is cached per path together with the file's (st_dev, st_ino, st_size,
+    st_mtime_ns) after the last append, and repeated whenever any of them differs,
+    i.e. when the file was replaced, truncated or written by someone else.
+    Rolling statistics are updated as for append_nutrient_reading.
+    
+    Args:
+        readings (list): List of dictionaries containing nutrient reading data
+        file_path (str): Path to the nutrient levels file
+        
+    Returns:
+        bool: True if the readings were appended successfully
+    """
+    # TODO: Implement append nutrient readings function
+    pass
+
+
+def nutrient_stats(window=7, file_path="nutrient_levels.csv"):
+    """
+    Returns rolling statistics over the most recent readings from the
+    "<file_path>.rolling" sidecar using read ('r') mode, without reading the CSV.
+    
+    Args:
+        window (int): Window size in readings (one of the tracked windows)
+        file_path (str): Path to the nutrient levels file
+        
+    Returns:
+        dict: Mapping of "nitrogen", "phosphorus", "potassium" and "ec_level" to dictionaries
+              with "mean", "min", "max" and "trend" (newest minus oldest value in the window)
+    """
+    # TODO: Implement nutrient stats function
+    pass
+
+
+def rebuild_nutrient_stats(file_path="nutrient_levels.csv", windows=NUTRIENT_STAT_WINDOWS):
+    """
+    Rebuilds the rolling statistics sidecar from the CSV file using read ('r') mode
+    and writes it using write ('w') mode.
+    
+    Args:
+        file_path (str): Path to the nutrient levels file
+        windows (tuple): Window sizes in readings to track
+        
+    Returns:
+        bool: True if the statistics were rebuilt successfully
+    """
+    # TODO: Implement rebuild nutrient stats function
+    pass
+
+
+def read_nutrient_store(store_dir="nutrient_store", columns=None):
+    """
+    Reads nutrient history from a columnar store: one binary file per column
+    ("<column>.bin", packed with the array module) plus "manifest.json" recording
+    each column's typecode and the row count. Only the requested column files are
+    opened, in binary read ('rb') mode, and memory-mapped where possible.
+    Dates are stored as epoch seconds (typecode 'q', naive times read as UTC) and
+    each date's format ("YYYY-MM-DD", "YYYY-MM-DD HH:MM" or "YYYY-MM-DD HH:MM:SS")
+    as a one-byte code in "date_format.bin", so they are returned as appended.
+    
+    Args:
+        store_dir (str): Path to the columnar store directory
+        columns (list): Column names to load (None for all columns)
+        
+    Returns:
+        dict: Mapping of column name to an array of values (list of strings for "date")
+    """
+    # TODO: Implement read nutrient store function
+    pass
+
+
+def join_sensor_nutrients(sensor_file_path="sensor_readings.txt", nutrient_file_path="nutrient_levels.csv", how="inner"):
+    """
+    Joins sensor readings with nutrient readings by date. Before anything is
+    yielded, a streaming pre-pass over both files checks that their dates are in
+    order. Sorted inputs are then streamed with iter_sensor_data and
+    iter_nutrient_levels and merge-joined in constant memory; otherwise the
+    nutrient readings are loaded into an index by date (kept sorted for "asof")
+    and each sensor reading is looked up in it as a hash join.
+    
+    Args:
+        sensor_file_path (str): Path to the sensor readings file
+        nutrient_file_path (str): Path to the nutrient levels file
+        how (str): "inner", "left" (nutrient fields None when missing) or
+                   "asof" (nearest nutrient reading on or before the sensor date)
+        
+    Yields:
+        dict: Sensor reading merged with the nutrient fields "nitrogen", "phosphorus",
+              "potassium" and "ec_level" (converted to float per NUTRIENT_SCHEMA)
+    """
+    # TODO: Implement join sensor nutrients generator
+    pass
+
+
+def resample_readings(records, period="day", fields=None):
+    """
+    Downsamples time-ordered readings (e.g. from iter_sensor_data or
+    iter_nutrient_levels) in a single pass, closing each bucket as soon as a
+    reading from a later bucket arrives. Dates may be "YYYY-MM-DD" or
+    "YYYY-MM-DD HH:MM[:SS]"; weeks start on Monday.
+    
+    Args:
+        records (iterable): Readings as dictionaries with a "date" key
+        period (str): Bucket size: "minute", "hour", "day" or "week"
+        fields (list): Numeric fields to aggregate (None for every field except "date")
+        
+    Yields:
+        dict: Bucket with "period" (bucket start), "count", and "<field>_mean",
+              "<field>_min" and "<field>_max" for each field
+    """
+    # TODO: Implement resample readings generator
+    pass
+
+
+def save_resampled(records, output_file_path, period="day", fields=None):
+    """
+    Writes the buckets produced by resample_readings to a CSV file using write ('w') mode,
+    with a header row of the bucket keys.
+    
+    Args:
+        records (iterable): Readings as dictionaries with a "date" key
+        output_file_path (str): Path to the downsampled output file
+        period (str): Bucket size: "minute", "hour", "day" or "week"
+        fields (list): Numeric fields to aggregate (None for every field except "date")
+        
+    Returns:
+        bool: True if the downsampled file was written successfully
+    """
+    # TODO: Implement save resampled function
+    pass
+
+
+def check_alerts(sensor_readings, nutrient_readings, recipe_name, recipes_file_path="recipes.txt",
+                 bounds=None, log_file_path="system_log.txt"):
+    """
+    Checks batches of readings against the recipe's "pH Range" (ph_level) and
+    "EC Range" (ec_level) from read_recipes and against environmental bounds,
+    comparing whole columns at once (NumPy arrays when NumPy is available).
+    Consecutive violating readings of a field form one excursion, and each
+    excursion is logged once as an "Alert" event naming the field through
+    log_system_events. Debouncing spans calls: an excursion still open at the last
+    reading of a batch is kept in "<log_file_path>.alerts" under its recipe name and
+    field, and nothing else is carried over. A later batch whose first reading is
+    dated after that tail and is still out of range continues the excursion without
+    logging it again; a batch dated on or before the tail, such as a backfill, is
+    evaluated on its own and leaves the tail in place.
+    
+    Args:
+        sensor_readings (list): Sensor readings as returned by read_sensor_data
+        nutrient_readings (list): Nutrient readings as returned by read_nutrient_levels
+        recipe_name (str): Name of the active recipe
+        recipes_file_path (str): Path to the recipes file
+        bounds (dict): Mapping of sensor field to (min, max) (defaults to SENSOR_ALERT_BOUNDS)
+        log_file_path (str): Path to the log file
+        
+    Returns:
+        list: List of excursions seen in this call as dictionaries with keys "field",
+              "start", "end", "value" (furthest reading from the range), "min", "max"
+              and "continued" (True if it began in an earlier call and was not logged again)
+    """
+    # TODO: Implement check alerts function
+    pass
+
+
+def generate_weekly_report(data_file_path, output_file_path="weekly_report.txt", period=None, incremental=False):
     """
     Generates a weekly report from sensor data using read ('r') and write ('w') modes.
+    With the default period and incremental arguments this is equivalent to
+    generate_report_outputs with a single "text" output.
+    Readings are streamed once through iter_sensor_data and folded into
+    update_report_stats while each DAILY READINGS line is written straight to the
+    output; the AVERAGES section and a PERCENTILES section (median, p95 and p99 of
+    temperature, pH and light level from report_percentile) are written into space
+    reserved at the top of the file once the pass is complete, so memory use does
+    not grow with the data.
     
     Args:
         data_file_path (str): Path to the sensor readings file
         output_file_path (str): Path to the output report file
+        period (str): Bucket the DAILY READINGS section with resample_readings
+                      ("minute", "hour", "day" or "week"); None lists every reading
+        incremental (bool): Persist the aggregate and the consumed source offset in
+                            "<output_file_path>.state" and, on the next run, fold in only
+                            readings appended since then: the reserved header is rewritten
+                            in place using read/write ('r+') mode and the new DAILY READINGS
+                            lines are appended to the existing report. With a period, the
+                            last (still open) bucket's aggregate and the byte offset of its
+                            line are kept in the state too; the report is truncated at that
+                            offset and the bucket is rewritten with the new readings merged
+                            in. A full rebuild is done when the report is missing or its
+                            size/mtime differ from the state, or when the source was
+                            rewritten (inode change, shrink, or a changed fingerprint of
+                            the bytes before the saved offset)
         
     Returns:
         bool: True if the report was generated successfully
@@ -111,10 +626,210 @@ def generate_weekly_report(data_file_path, output_file_path="weekly_report.txt")
     pass
 
 
-def search_logs(search_term, file_path="system_log.txt"):
+def new_report_stats():
+    """
+    Creates an empty report aggregate for update_report_stats.
+    
+    Returns:
+        dict: Aggregate with "count", "first_date", "last_date" and, for each of
+              "temperature", "humidity", "ph_level" and "light_level", a dictionary
+              with "count", "mean", "m2" (sum of squared deviations), "min", "max" and
+              "sketch" (list of [mean, weight] centroids of a quantile sketch)
+    """
+    # TODO: Implement new report stats function
+    pass
+
+
+def update_report_stats(stats, reading):
+    """
+    Folds one sensor reading into a report aggregate using Welford's running
+    mean/variance update, running min/max and a t-digest style quantile sketch
+    bounded by REPORT_SKETCH_SIZE, in constant memory.
+    
+    Args:
+        stats (dict): Aggregate created by new_report_stats
+        reading (dict): Sensor reading as returned by read_sensor_data
+        
+    Returns:
+        dict: The updated aggregate
+    """
+    # TODO: Implement update report stats function
+    pass
+
+
+def merge_report_stats(first, second):
+    """
+    Merges two report aggregates, e.g. from separate partitions or workers.
+    Means and variances are combined with Chan's parallel update and the quantile
+    sketches are merged and recompressed to REPORT_SKETCH_SIZE.
+    
+    Args:
+        first (dict): Aggregate created by new_report_stats
+        second (dict): Aggregate created by new_report_stats
+        
+    Returns:
+        dict: A new aggregate covering the readings of both inputs
+    """
+    # TODO: Implement merge report stats function
+    pass
+
+
+def report_percentile(stats, field, percentile):
+    """
+    Estimates a percentile of a field from the quantile sketch in a report aggregate.
+    
+    Args:
+        stats (dict): Aggregate created by new_report_stats
+        field (str): One of "temperature", "humidity", "ph_level" or "light_level"
+        percentile (float): Percentile to estimate, between 0 and 100
+        
+    Returns:
+        float: Estimated value at that percentile, or None if the field has no readings
+    """
+    # TODO: Implement report percentile function
+    pass
+
+
+def generate_zone_report(data_file_path, output_file_path="weekly_report.txt"):
+    """
+    Generates the weekly report for one zone exactly like generate_weekly_report,
+    but returns the report aggregate instead of a status so that
+    generate_batch_reports workers can hand it back for merging.
+    
+    Args:
+        data_file_path (str): Path to the sensor readings file
+        output_file_path (str): Path to the output report file
+        
+    Returns:
+        dict: Aggregate created by new_report_stats, or None if the report could not be generated
+    """
+    # TODO: Implement generate zone report function
+    pass
+
+
+def render_report(stats, output_file_path, fmt="text", readings=None):
+    """
+    Renders a report aggregate to a file using write ('w') mode in one of
+    REPORT_FORMATS. Any number of renderers can consume the same aggregate.
+    
+    Args:
+        stats (dict): Aggregate created by new_report_stats
+        output_file_path (str): Path to the output report file
+        fmt (str): "text" (the weekly_report.txt layout), "json" (an object with "period",
+                   "count", "averages" and "daily_readings" keys), "csv" or "html"
+        readings (iterable): Readings to stream into the DAILY READINGS section (None to omit it)
+        
+    Returns:
+        bool: True if the report was rendered successfully
+    """
+    # TODO: Implement render report function
+    pass
+
+
+def generate_report_outputs(data_file_path, output_file_paths):
+    """
+    Generates the same report in several formats from one aggregation pass over
+    the sensor data. Every output is opened up front and each reading is streamed
+    into each output's DAILY READINGS section as it is read; the summary sections
+    are rendered from the shared aggregate once the pass is complete.
+    
+    Args:
+        data_file_path (str): Path to the sensor readings file
+        output_file_paths (dict): Mapping of format (one of REPORT_FORMATS) to output file path
+        
+    Returns:
+        bool: True if every report was generated successfully
+    """
+    # TODO: Implement generate report outputs function
+    pass
+
+
+def generate_period_reports(data_file_path, output_file_paths=None):
+    """
+    Generates daily, weekly and monthly summary reports from a single read of the
+    sensor data using read ('r') mode. One aggregation pass keeps an
+    update_report_stats aggregate per open period of each granularity (weeks start
+    on Monday and months are calendar months, as in resample_readings), and every
+    finished period's AVERAGES (Temperature, Humidity, pH Level, Light Level) are
+    written to that granularity's report using write ('w') mode.
+    
+    Args:
+        data_file_path (str): Path to the sensor readings file
+        output_file_paths (dict): Mapping of "daily", "weekly" and/or "monthly" to output
+                                  file paths (defaults to "daily_summary_report.txt",
+                                  "weekly_summary_report.txt" and "monthly_summary_report.txt")
+        
+    Returns:
+        bool: True if the reports were generated successfully
+    """
+    # TODO: Implement generate period reports function
+    pass
+
+
+def generate_batch_reports(jobs, fleet_output_file_path="fleet_report.txt", workers=None):
+    """
+    Generates weekly reports for many zones in parallel on a process pool. Each
+    worker runs generate_zone_report for one (data_file_path, output_file_path)
+    pair, which returns its report aggregate; the aggregates are combined with
+    merge_report_stats into a fleet-level summary written using write ('w') mode,
+    without re-reading any sensor data.
+    
+    Args:
+        jobs (list): List of (data_file_path, output_file_path) tuples
+        fleet_output_file_path (str): Path to the combined fleet report file
+        workers (int): Number of worker processes (None for the CPU count)
+        
+    Returns:
+        dict: Mapping of each output file path to True if its report was generated successfully
+    """
+    # TODO: Implement generate batch reports function
+    pass
+
+
+def search_logs(search_term, file_path="system_log.txt", limit=None, offset=0):
     """
     Searches the log file for entries containing a specific term using read ('r') mode.
     
+    Args:
+        search_term (str): Term to search for
+        file_path (str): Path to the log file
+        limit (int): Maximum number of entries to return (None for all)
+        offset (int): Number of matching entries to skip before collecting
+        
+    Returns:
+        list: List of log entries containing the search term
+    """
+    # TODO: Implement search logs function (collect from iter_search_logs,
+    # using mmap_search_logs as the fast path when no limit or offset is given)
+    pass
+
+
+def iter_search_logs(search_term, file_path="system_log.txt", limit=None, offset=0):
+    """
+    Lazily searches the log file for entries containing a specific term using read ('r') mode.
+    Stops reading the file as soon as 'limit' entries have been produced.
+    
+    Args:
+        search_term (str): Term to search for
+        file_path (str): Path to the log file
+        limit (int): Maximum number of entries to yield (None for all)
+        offset (int): Number of matching entries to skip before yielding
+        
+    Yields:
+        dict: Log entry with keys "timestamp", "event_type" and "message"
+    """
+    # TODO: Implement iter search logs generator
+    pass
+
+
+def mmap_search_logs(search_term, file_path="system_log.txt"):
+    """
+    Searches the log file by memory-mapping it in binary read ('rb') mode and
+    scanning for the encoded search term with bytes.find, decoding only the
+    lines around each hit. Returns exactly what search_logs returns, including
+    case-insensitive and non-ASCII terms (falling back to text mode when the
+    term cannot be matched byte-wise).
+    
     Args:
         search_term (str): Term to search for
         file_path (str): Path to the log file
@@ -122,17 +837,86 @@ def search_logs(search_term, file_path="system_log.txt"):
     Returns:
         list: List of log entries containing the search term
     """
-    # TODO: Implement search logs function
+    # TODO: Implement mmap search logs function
+    pass
+
+
+def search_logs_latest(search_term, file_path="system_log.txt", limit=20, block_size=65536):
+    """
+    Searches the log file backwards from the end using binary read ('rb') mode,
+    reading 'block_size' bytes at a time and stopping once 'limit' matching
+    entries have been found.
+    
+    Args:
+        search_term (str): Term to search for
+        file_path (str): Path to the log file
+        limit (int): Number of most recent matching entries to return
+        block_size (int): Number of bytes to read per backward step
+        
+    Returns:
+        list: List of the most recent log entries containing the search term, newest first
+    """
+    # TODO: Implement search logs latest function
+    pass
+
+
+def cached_search_logs(search_term, file_path="system_log.txt", limit=None, offset=0):
+    """
+    Searches the log file like search_logs, remembering each result under
+    (file_path, search_term, limit, offset) together with the byte offset scanned
+    up to. A repeated query only reads the newly appended tail in binary read ('rb')
+    mode and merges it into the cached result; a result that already holds 'limit'
+    entries is returned without reading. Entries are invalidated when the log
+    shrinks or is replaced (rotation/truncation) and evicted least-recently-used
+    beyond SEARCH_CACHE_SIZE, read at call time.
+    
+    Args:
+        search_term (str): Term to search for
+        file_path (str): Path to the log file
+        limit (int): Maximum number of entries to return (None for all)
+        offset (int): Number of matching entries to skip before collecting
+        
+    Returns:
+        list: List of log entries containing the search term
+    """
+    # TODO: Implement cached search logs function
+    pass
+
+
+def clear_search_cache():
+    """
+    Empties the cache used by cached_search_logs.
+    
+    Returns:
+        bool: True if the cache was cleared successfully
+    """
+    # TODO: Implement clear search cache function
+    pass
+
+
+def search_cache_info():
+    """
+    Describes the current contents of the cache used by cached_search_logs.
+    
+    Returns:
+        dict: Dictionary with "max_size" (SEARCH_CACHE_SIZE) and "keys", the cached
+              (file_path, search_term, limit, offset) tuples from least to most recently used
+    """
+    # TODO: Implement search cache info function
     pass
 
 
-def backup_data_files(source_path, backup_path):
+def backup_data_files(source_path, backup_path, chunk_size=BACKUP_CHUNK_SIZE):
     """
-    Creates backup copies of data files using read ('r') and write ('w') modes.
+    Creates backup copies of data files using binary read ('rb') and write ('wb') modes,
+    so newlines and encoding are preserved byte for byte. The copy is done in the
+    kernel with os.copy_file_range or os.sendfile where supported, falling back to
+    reading and writing 'chunk_size' bytes at a time.
     
     Args:
         source_path (str): Path to the source file
         backup_path (str): Path to the backup file
+        chunk_size (int): Number of bytes per read/write in the chunked fallback
         
     Returns:
         bool: True if the backup was created successfully
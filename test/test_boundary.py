@@ -65,6 +65,8 @@ class TestHydroponicBoundary(unittest.TestCase):
             # Create empty test files
             empty_files = ["empty_sensor.txt", "empty_nutrients.csv", "empty_log.txt", "empty_recipes.txt"]
             test_files.extend(empty_files)
+            sidecar_files = ["empty_recipes.txt.idx", "empty_recipes.txt.versions", "empty_recipes.txt.lock", "empty_recipes.txt.history", "empty_recipes.txt.history.idx"]
+            test_files.extend(sidecar_files)
             
             for file in empty_files:
                 try:
@@ -165,7 +167,7 @@ class TestHydroponicBoundary(unittest.TestCase):
             
             # ============ SECTION 3: EXTREME VALUES HANDLING ============
             
-            extreme_files = ["extreme_sensor.txt", "extreme_nutrients.csv", "long_log.txt"]
+            extreme_files = ["extreme_sensor.txt", "extreme_nutrients.csv", "extreme_nutrients.csv.rolling", "long_log.txt", "long_log.txt.stats"]
             test_files.extend(extreme_files)
             
             # Test with extreme values in data
@@ -233,7 +235,7 @@ class TestHydroponicBoundary(unittest.TestCase):
             
             # ============ SECTION 4: BOUNDARY DATA RANGES ============
             
-            boundary_files = ["boundary_sensor.txt", "boundary_nutrients.csv"]
+            boundary_files = ["boundary_sensor.txt", "boundary_nutrients.csv", "boundary_nutrients.csv.rolling"]
             test_files.extend(boundary_files)
             
             # Test boundary pH values
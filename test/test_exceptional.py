@@ -261,7 +261,7 @@ class TestHydroponicException(unittest.TestCase):
             
             # ============ SECTION 5: INCOMPLETE DATA STRUCTURES ============
             
-            incomplete_files = ["incomplete_test.txt", "incomplete_nutrients.csv"]
+            incomplete_files = ["incomplete_test.txt", "incomplete_nutrients.csv", "incomplete_nutrients.csv.rolling"]
             test_files.extend(incomplete_files)
             
             # Test with incomplete sensor readings
@@ -3,6 +3,14 @@ import os
 import sys
 import importlib
 import inspect
+import multiprocessing
+import time
+import shutil
+import json
+import csv
+import statistics
+from datetime import datetime, timedelta
+from unittest import mock
 from io import StringIO
 from contextlib import redirect_stdout, redirect_stderr
 from test.TestUtils import TestUtils
@@ -45,6 +53,27 @@ def load_module_dynamically():
         module_obj = safely_import_module("solution")
     return module_obj
 
+def recipe_stress_worker(worker_id, iterations, file_path):
+    """Increment the shared counter recipe with optimistic retries and rewrite this worker's own recipe,
+    alternating between in-place update_recipe and whole-file update_recipes."""
+    module_obj = load_module_dynamically()
+    conflict_error = getattr(module_obj, "RecipeConflictError", Exception)
+    with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+        for step in range(iterations):
+            while True:
+                version = module_obj.get_recipe_version("Counter", file_path)
+                count = int(module_obj.get_recipe("Counter", file_path).split(":")[1])
+                try:
+                    if module_obj.update_recipe("Counter", f"Count: {count + 1}", file_path, expected_version=version):
+                        break
+                except conflict_error:
+                    continue
+            if step % 2:
+                module_obj.update_recipes({f"Worker {worker_id}": f"Step: {step}"}, file_path)
+            else:
+                module_obj.update_recipe(f"Worker {worker_id}", f"Step: {step}", file_path)
+    return True
+
 class TestHydroponicFunctional(unittest.TestCase):
     def setUp(self):
         """Standard setup for all test methods"""
@@ -69,7 +98,45 @@ class TestHydroponicFunctional(unittest.TestCase):
                 "append_nutrient_reading": 1,  # reading required, file_path has default
                 "generate_weekly_report": 1,  # data_file_path required, output_file_path has default
                 "search_logs": 1,  # search_term required, file_path has default
+                "iter_search_logs": 1,  # search_term required, file_path, limit and offset have defaults
                 "backup_data_files": 2,  # source_path and backup_path required
+                "log_event_stats": 0,  # since, until, bucket and file_path have defaults
+                "rebuild_log_event_stats": 0,  # file_path has default
+                "mmap_search_logs": 1,  # search_term required, file_path has default
+                "search_logs_latest": 1,  # search_term required, file_path, limit and block_size have defaults
+                "cached_search_logs": 1,  # search_term required, file_path has default
+                "clear_search_cache": 0,  # no required parameters
+                "build_recipe_index": 0,  # file_path has default
+                "get_recipe": 1,  # recipe_name required, file_path has default
+                "convert_recipes_to_slots": 0,  # file_path and slot_capacity have defaults
+                "compact_recipes": 0,  # file_path has default
+                "get_recipe_version": 1,  # recipe_name required, file_path has default
+                "update_recipes": 1,  # updates required, file_path has default
+                "read_recipes": 0,  # file_path has default
+                "get_recipe_as_of": 2,  # recipe_name and timestamp required, file_path has default
+                "compact_recipe_history": 0,  # file_path and retention_days have defaults
+                "read_nutrient_columns": 0,  # file_path, schema and as_numpy have defaults
+                "append_nutrient_readings": 1,  # readings required, file_path has default
+                "nutrient_stats": 0,  # window and file_path have defaults
+                "rebuild_nutrient_stats": 0,  # file_path and windows have defaults
+                "read_nutrient_store": 0,  # store_dir and columns have defaults
+                "iter_sensor_data": 0,  # file_path has default
+                "iter_nutrient_levels": 0,  # file_path has default
+                "join_sensor_nutrients": 0,  # file paths and how have defaults
+                "resample_readings": 1,  # records required, period and fields have defaults
+                "save_resampled": 2,  # records and output_file_path required, period and fields have defaults
+                "log_system_events": 1,  # events required, file_path has default
+                "check_alerts": 3,  # readings and recipe_name required, other parameters have defaults
+                "new_report_stats": 0,  # no required parameters
+                "update_report_stats": 2,  # stats and reading required
+                "generate_period_reports": 1,  # data_file_path required, output_file_paths has default
+                "merge_report_stats": 2,  # first and second required
+                "report_percentile": 3,  # stats, field and percentile required
+                "generate_batch_reports": 1,  # jobs required, fleet_output_file_path and workers have defaults
+                "render_report": 2,  # stats and output_file_path required, fmt and readings have defaults
+                "generate_report_outputs": 2,  # data_file_path and output_file_paths required
+                "search_cache_info": 0,  # no required parameters
+                "generate_zone_report": 1,  # data_file_path required, output_file_path has default
                 "create_sample_data": 0,  # no required parameters
                 "main": 0  # no required parameters
             }
@@ -267,14 +334,14 @@ class TestHydroponicFunctional(unittest.TestCase):
                 return
             
             # Clean up test files
-            cleanup_test_files(["test_sensor_data.txt", "test_log.txt"])
+            cleanup_test_files(["test_sensor_data.txt", "test_log.txt", "test_log.txt.stats"])
             
             # All tests passed
             self.test_obj.yakshaAssert("TestFileOperationsFunctionality", True, "functional")
             print("TestFileOperationsFunctionality = Passed")
 
         except Exception:
-            cleanup_test_files(["test_sensor_data.txt", "test_log.txt"])
+            cleanup_test_files(["test_sensor_data.txt", "test_log.txt", "test_log.txt.stats"])
             self.test_obj.yakshaAssert("TestFileOperationsFunctionality", False, "functional")
             print("TestFileOperationsFunctionality = Failed")
 
@@ -402,14 +469,14 @@ class TestHydroponicFunctional(unittest.TestCase):
                             return
             
             # Clean up test files
-            cleanup_test_files(["test_nutrients.csv"])
+            cleanup_test_files(["test_nutrients.csv", "test_nutrients.csv.rolling"])
             
             # All tests passed
             self.test_obj.yakshaAssert("TestCsvOperationsFunctionality", True, "functional")
             print("TestCsvOperationsFunctionality = Passed")
 
         except Exception:
-            cleanup_test_files(["test_nutrients.csv"])
+            cleanup_test_files(["test_nutrients.csv", "test_nutrients.csv.rolling"])
             self.test_obj.yakshaAssert("TestCsvOperationsFunctionality", False, "functional")
             print("TestCsvOperationsFunctionality = Failed")
 
@@ -487,14 +554,14 @@ pH Range: 5.9-6.3"""
                     return
             
             # Clean up test files
-            cleanup_test_files(["test_recipes.txt"])
+            cleanup_test_files(["test_recipes.txt", "test_recipes.txt.idx", "test_recipes.txt.versions", "test_recipes.txt.lock", "test_recipes.txt.history", "test_recipes.txt.history.idx"])
             
             # All tests passed
             self.test_obj.yakshaAssert("TestRecipeUpdateFunctionality", True, "functional")
             print("TestRecipeUpdateFunctionality = Passed")
 
         except Exception:
-            cleanup_test_files(["test_recipes.txt"])
+            cleanup_test_files(["test_recipes.txt", "test_recipes.txt.idx", "test_recipes.txt.versions", "test_recipes.txt.lock", "test_recipes.txt.history", "test_recipes.txt.history.idx"])
             self.test_obj.yakshaAssert("TestRecipeUpdateFunctionality", False, "functional")
             print("TestRecipeUpdateFunctionality = Failed")
 
@@ -946,5 +1013,2181 @@ pH Range: 5.9-6.3"""
             self.test_obj.yakshaAssert("TestIntegrationWorkflow", False, "functional")
             print("TestIntegrationWorkflow = Failed")
 
+    def test_search_logs_limit_and_offset(self):
+        """Test streaming log search with limit and offset"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                print("TestSearchLogsLimitAndOffset = Failed")
+                return
+
+            # Create a log file with known entries
+            try:
+                with open("test_limit_log.txt", "w") as f:
+                    for i in range(10):
+                        f.write(f"2023-06-01 10:00:{i:02d},Pump,Pump cycle {i}\n")
+                    f.write("2023-06-01 11:00:00,Sensor,Sensor calibrated\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                print("TestSearchLogsLimitAndOffset = Failed")
+                return
+
+            # Test limit and offset on search_logs
+            if check_function_exists(self.module_obj, "search_logs"):
+                result = safely_call_function(self.module_obj, "search_logs", "pump", "test_limit_log.txt", limit=3, offset=2)
+                if result is None or not isinstance(result, list) or len(result) != 3:
+                    self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                    print("TestSearchLogsLimitAndOffset = Failed")
+                    return
+                elif result[0].get("message") != "Pump cycle 2" or result[2].get("message") != "Pump cycle 4":
+                    self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                    print("TestSearchLogsLimitAndOffset = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                print("TestSearchLogsLimitAndOffset = Failed")
+                return
+
+            # Test the generator yields entries with the same shape
+            if check_function_exists(self.module_obj, "iter_search_logs"):
+                result = safely_call_function(self.module_obj, "iter_search_logs", "pump", "test_limit_log.txt", limit=5)
+                if result is None or not inspect.isgenerator(result):
+                    self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                    print("TestSearchLogsLimitAndOffset = Failed")
+                    return
+                else:
+                    try:
+                        entries = list(result)
+                    except Exception:
+                        entries = []
+                    if len(entries) != 5:
+                        self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                        print("TestSearchLogsLimitAndOffset = Failed")
+                        return
+                    for entry in entries:
+                        if not isinstance(entry, dict) or any(field not in entry for field in ["timestamp", "event_type", "message"]):
+                            self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                            print("TestSearchLogsLimitAndOffset = Failed")
+                            return
+            else:
+                self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+                print("TestSearchLogsLimitAndOffset = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_limit_log.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", True, "functional")
+            print("TestSearchLogsLimitAndOffset = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_limit_log.txt"])
+            self.test_obj.yakshaAssert("TestSearchLogsLimitAndOffset", False, "functional")
+            print("TestSearchLogsLimitAndOffset = Failed")
+
+    def test_log_event_stats(self):
+        """Test event counters maintained alongside the log"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                print("TestLogEventStats = Failed")
+                return
+
+            cleanup_test_files(["test_stats_log.txt", "test_stats_log.txt.stats"])
+
+            # Log a few events of different types
+            for event_type, message in [("Pump", "Pump started"), ("Pump", "Pump stopped"), ("Alert", "pH low")]:
+                if check_function_exists(self.module_obj, "log_system_event"):
+                    result = safely_call_function(self.module_obj, "log_system_event", event_type, message, "test_stats_log.txt")
+                    if result is None or result is not True:
+                        self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                        print("TestLogEventStats = Failed")
+                        return
+                else:
+                    self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                    print("TestLogEventStats = Failed")
+                    return
+
+            # Test counters answered from the sidecar, hourly and daily
+            for bucket in ["hour", "day"]:
+                if check_function_exists(self.module_obj, "log_event_stats"):
+                    result = safely_call_function(self.module_obj, "log_event_stats", None, None, bucket, "test_stats_log.txt")
+                    if result is None or not isinstance(result, dict):
+                        self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                        print("TestLogEventStats = Failed")
+                        return
+                    else:
+                        totals = {}
+                        for counts in result.values():
+                            for event_type, count in counts.items():
+                                totals[event_type] = totals.get(event_type, 0) + count
+                        if totals.get("Pump") != 2 or totals.get("Alert") != 1:
+                            self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                            print("TestLogEventStats = Failed")
+                            return
+                else:
+                    self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                    print("TestLogEventStats = Failed")
+                    return
+
+            # Test a window in the past returns no buckets
+            result = safely_call_function(self.module_obj, "log_event_stats", None, "2000-01-01 00:00:00", "hour", "test_stats_log.txt")
+            if result is None or result != {}:
+                self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                print("TestLogEventStats = Failed")
+                return
+
+            # Test rebuilding from scratch gives the same counters
+            expected = safely_call_function(self.module_obj, "log_event_stats", None, None, "hour", "test_stats_log.txt")
+            cleanup_test_files(["test_stats_log.txt.stats"])
+            if check_function_exists(self.module_obj, "rebuild_log_event_stats"):
+                result = safely_call_function(self.module_obj, "rebuild_log_event_stats", "test_stats_log.txt")
+                if result is None or result is not True:
+                    self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                    print("TestLogEventStats = Failed")
+                    return
+                rebuilt = safely_call_function(self.module_obj, "log_event_stats", None, None, "hour", "test_stats_log.txt")
+                if rebuilt is None or rebuilt != expected:
+                    self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                    print("TestLogEventStats = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+                print("TestLogEventStats = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_stats_log.txt", "test_stats_log.txt.stats"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestLogEventStats", True, "functional")
+            print("TestLogEventStats = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_stats_log.txt", "test_stats_log.txt.stats"])
+            self.test_obj.yakshaAssert("TestLogEventStats", False, "functional")
+            print("TestLogEventStats = Failed")
+
+    def test_mmap_search_logs_matches_text_search(self):
+        """Test the mmap fast path returns the same entries as text-mode search"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestMmapSearchLogs", False, "functional")
+                print("TestMmapSearchLogs = Failed")
+                return
+
+            # Create a log file with mixed-case and non-ASCII entries
+            try:
+                with open("test_mmap_log.txt", "w", encoding="utf-8") as f:
+                    f.write("2023-06-01 10:00:00,Pump,Pump started\n")
+                    f.write("2023-06-01 10:05:00,Alert,Température élevée in zone B\n")
+                    f.write("2023-06-01 10:10:00,PUMP,pump stopped\n")
+                    f.write("2023-06-01 10:15:00,Sensor,Sensor calibrated")
+            except Exception:
+                self.test_obj.yakshaAssert("TestMmapSearchLogs", False, "functional")
+                print("TestMmapSearchLogs = Failed")
+                return
+
+            # Test each term gives identical output to the text-mode generator
+            for term, count in [("pump", 2), ("Température", 1), ("ÉLEVÉE", 1), ("calibrated", 1), ("missing", 0)]:
+                if check_function_exists(self.module_obj, "mmap_search_logs") and check_function_exists(self.module_obj, "iter_search_logs"):
+                    try:
+                        expected = list(safely_call_function(self.module_obj, "iter_search_logs", term, "test_mmap_log.txt"))
+                    except Exception:
+                        expected = None
+                    result = safely_call_function(self.module_obj, "mmap_search_logs", term, "test_mmap_log.txt")
+                    if result is None or expected is None or len(expected) != count or result != expected:
+                        self.test_obj.yakshaAssert("TestMmapSearchLogs", False, "functional")
+                        print("TestMmapSearchLogs = Failed")
+                        return
+                else:
+                    self.test_obj.yakshaAssert("TestMmapSearchLogs", False, "functional")
+                    print("TestMmapSearchLogs = Failed")
+                    return
+
+            # Test the fast path on an empty file
+            try:
+                with open("test_mmap_empty_log.txt", "w") as f:
+                    pass
+            except Exception:
+                self.test_obj.yakshaAssert("TestMmapSearchLogs", False, "functional")
+                print("TestMmapSearchLogs = Failed")
+                return
+            result = safely_call_function(self.module_obj, "mmap_search_logs", "pump", "test_mmap_empty_log.txt")
+            if result is None or result != []:
+                self.test_obj.yakshaAssert("TestMmapSearchLogs", False, "functional")
+                print("TestMmapSearchLogs = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_mmap_log.txt", "test_mmap_empty_log.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestMmapSearchLogs", True, "functional")
+            print("TestMmapSearchLogs = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_mmap_log.txt", "test_mmap_empty_log.txt"])
+            self.test_obj.yakshaAssert("TestMmapSearchLogs", False, "functional")
+            print("TestMmapSearchLogs = Failed")
+
+    def test_search_logs_latest(self):
+        """Test reverse search returns the most recent matches newest first"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+                print("TestSearchLogsLatest = Failed")
+                return
+
+            # Create a log file with interleaved entries and no trailing newline
+            try:
+                with open("test_latest_log.txt", "w") as f:
+                    lines = []
+                    for i in range(30):
+                        lines.append(f"2023-06-01 10:{i:02d}:00,Pump,Pump error {i}")
+                        lines.append(f"2023-06-01 10:{i:02d}:30,Sensor,Sensor ok {i}")
+                    f.write("\n".join(lines))
+            except Exception:
+                self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+                print("TestSearchLogsLatest = Failed")
+                return
+
+            # Test small blocks so entries straddle block boundaries
+            for block_size in [16, 65536]:
+                if check_function_exists(self.module_obj, "search_logs_latest"):
+                    result = safely_call_function(self.module_obj, "search_logs_latest", "pump error", "test_latest_log.txt", 5, block_size)
+                    if result is None or not isinstance(result, list) or len(result) != 5:
+                        self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+                        print("TestSearchLogsLatest = Failed")
+                        return
+                    elif [entry.get("message") for entry in result] != [f"Pump error {i}" for i in range(29, 24, -1)]:
+                        self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+                        print("TestSearchLogsLatest = Failed")
+                        return
+                else:
+                    self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+                    print("TestSearchLogsLatest = Failed")
+                    return
+
+            # Test asking for more than exist returns every match
+            result = safely_call_function(self.module_obj, "search_logs_latest", "sensor ok", "test_latest_log.txt", 100, 64)
+            if result is None or len(result) != 30:
+                self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+                print("TestSearchLogsLatest = Failed")
+                return
+
+            # Test missing file returns an empty list
+            result = safely_call_function(self.module_obj, "search_logs_latest", "pump", "nonexistent_latest_log.txt")
+            if result is None or result != []:
+                self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+                print("TestSearchLogsLatest = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_latest_log.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestSearchLogsLatest", True, "functional")
+            print("TestSearchLogsLatest = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_latest_log.txt"])
+            self.test_obj.yakshaAssert("TestSearchLogsLatest", False, "functional")
+            print("TestSearchLogsLatest = Failed")
+
+    def test_cached_search_logs(self):
+        """Test cached log search extends with appended entries and resets on truncation"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+
+            safely_call_function(self.module_obj, "clear_search_cache")
+            cleanup_test_files(["test_cache_log.txt"])
+
+            # Seed the log and prime the cache
+            for message in ["Pump started", "Sensor calibrated"]:
+                if safely_call_function(self.module_obj, "log_system_event", "Info", message, "test_cache_log.txt") is not True:
+                    self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                    print("TestCachedSearchLogs = Failed")
+                    return
+            if check_function_exists(self.module_obj, "cached_search_logs"):
+                result = safely_call_function(self.module_obj, "cached_search_logs", "pump", "test_cache_log.txt")
+                if result is None or len(result) != 1:
+                    self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                    print("TestCachedSearchLogs = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+
+            # Test appended entries are merged into the repeated query
+            safely_call_function(self.module_obj, "log_system_event", "Info", "Pump stopped", "test_cache_log.txt")
+            result = safely_call_function(self.module_obj, "cached_search_logs", "pump", "test_cache_log.txt")
+            expected = safely_call_function(self.module_obj, "search_logs", "pump", "test_cache_log.txt")
+            if result is None or len(result) != 2 or result != expected:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+
+            # Test truncation invalidates the cached entry
+            try:
+                with open("test_cache_log.txt", "w") as f:
+                    f.write("2023-06-01 10:00:00,Info,Pump primed\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+            result = safely_call_function(self.module_obj, "cached_search_logs", "pump", "test_cache_log.txt")
+            if result is None or [entry.get("message") for entry in result] != ["Pump primed"]:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+
+            # Test options are part of the cache key
+            result = safely_call_function(self.module_obj, "cached_search_logs", "pump", "test_cache_log.txt", 1, 0)
+            if result is None or len(result) != 1:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+
+            # Test least-recently-used eviction with a lowered bound
+            original_size = getattr(self.module_obj, "SEARCH_CACHE_SIZE", None)
+            try:
+                self.module_obj.SEARCH_CACHE_SIZE = 2
+                safely_call_function(self.module_obj, "clear_search_cache")
+                for term in ["pump", "primed", "pump", "info"]:
+                    safely_call_function(self.module_obj, "cached_search_logs", term, "test_cache_log.txt")
+                info = safely_call_function(self.module_obj, "search_cache_info")
+            finally:
+                self.module_obj.SEARCH_CACHE_SIZE = original_size
+            if info is None or [tuple(key) for key in info.get("keys", [])] != [("test_cache_log.txt", "pump", None, 0), ("test_cache_log.txt", "info", None, 0)]:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+
+            # Test the cache can be cleared
+            if safely_call_function(self.module_obj, "clear_search_cache") is not True:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+            info = safely_call_function(self.module_obj, "search_cache_info")
+            if info is None or info.get("keys") != []:
+                self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+                print("TestCachedSearchLogs = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_cache_log.txt", "test_cache_log.txt.stats"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestCachedSearchLogs", True, "functional")
+            print("TestCachedSearchLogs = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_cache_log.txt", "test_cache_log.txt.stats"])
+            self.test_obj.yakshaAssert("TestCachedSearchLogs", False, "functional")
+            print("TestCachedSearchLogs = Failed")
+
+    def test_recipe_index_lookup(self):
+        """Test byte-span recipe index, get_recipe and index refresh after updates"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                print("TestRecipeIndexLookup = Failed")
+                return
+
+            # Create a recipes file
+            initial_recipes = """Recipe: Leafy Greens
+Nitrogen: 180 ppm
+Phosphorus: 50 ppm
+
+Recipe: Tomatoes
+Nitrogen: 160 ppm
+Phosphorus: 60 ppm
+
+Recipe: Basil
+Nitrogen: 150 ppm
+Phosphorus: 40 ppm"""
+            try:
+                with open("test_index_recipes.txt", "w") as f:
+                    f.write(initial_recipes)
+            except Exception:
+                self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                print("TestRecipeIndexLookup = Failed")
+                return
+
+            # Test the index spans point at each recipe block
+            if check_function_exists(self.module_obj, "build_recipe_index"):
+                index = safely_call_function(self.module_obj, "build_recipe_index", "test_index_recipes.txt")
+                if index is None or not isinstance(index, dict) or set(index.keys()) != {"Leafy Greens", "Tomatoes", "Basil"}:
+                    self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                    print("TestRecipeIndexLookup = Failed")
+                    return
+                start, end = index["Tomatoes"]
+                with open("test_index_recipes.txt", "rb") as f:
+                    f.seek(start)
+                    block = f.read(end - start).decode("utf-8")
+                if not block.startswith("Recipe: Tomatoes") or "Nitrogen: 160 ppm" not in block or "Basil" in block:
+                    self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                    print("TestRecipeIndexLookup = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                print("TestRecipeIndexLookup = Failed")
+                return
+
+            # Test get_recipe reads a single recipe
+            if check_function_exists(self.module_obj, "get_recipe"):
+                result = safely_call_function(self.module_obj, "get_recipe", "Basil", "test_index_recipes.txt")
+                if result is None or "Nitrogen: 150 ppm" not in result or "Recipe:" in result:
+                    self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                    print("TestRecipeIndexLookup = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                print("TestRecipeIndexLookup = Failed")
+                return
+
+            # Test updates through the index keep later recipes intact
+            result = safely_call_function(self.module_obj, "update_recipe", "Leafy Greens", "Nitrogen: 185 ppm\nPhosphorus: 55 ppm\nPotassium: 215 ppm", "test_index_recipes.txt")
+            if result is not True:
+                self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                print("TestRecipeIndexLookup = Failed")
+                return
+            for name, expected in [("Leafy Greens", "Potassium: 215 ppm"), ("Tomatoes", "Nitrogen: 160 ppm"), ("Basil", "Phosphorus: 40 ppm")]:
+                result = safely_call_function(self.module_obj, "get_recipe", name, "test_index_recipes.txt")
+                if result is None or expected not in result:
+                    self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                    print("TestRecipeIndexLookup = Failed")
+                    return
+
+            # Test unknown recipes are reported as missing
+            if safely_call_function(self.module_obj, "get_recipe", "NonExistent Recipe", "test_index_recipes.txt") is not None:
+                self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+                print("TestRecipeIndexLookup = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_index_recipes.txt", "test_index_recipes.txt.idx", "test_index_recipes.txt.versions", "test_index_recipes.txt.lock", "test_index_recipes.txt.history", "test_index_recipes.txt.history.idx"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestRecipeIndexLookup", True, "functional")
+            print("TestRecipeIndexLookup = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_index_recipes.txt", "test_index_recipes.txt.idx", "test_index_recipes.txt.versions", "test_index_recipes.txt.lock", "test_index_recipes.txt.history", "test_index_recipes.txt.history.idx"])
+            self.test_obj.yakshaAssert("TestRecipeIndexLookup", False, "functional")
+            print("TestRecipeIndexLookup = Failed")
+
+    def test_recipe_slot_updates(self):
+        """Test in-place slot updates, relocation of oversized recipes and compaction"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+
+            cleanup_test_files(["test_slot_recipes.txt.idx", "test_slot_recipes.txt.versions", "test_slot_recipes.txt.lock", "test_slot_recipes.txt.history", "test_slot_recipes.txt.history.idx"])
+
+            # Create a recipes file and convert it to the slot layout
+            try:
+                with open("test_slot_recipes.txt", "w") as f:
+                    f.write("Recipe: Leafy Greens\nNitrogen: 180 ppm\n\nRecipe: Tomatoes\nNitrogen: 160 ppm")
+            except Exception:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+            if check_function_exists(self.module_obj, "convert_recipes_to_slots"):
+                result = safely_call_function(self.module_obj, "convert_recipes_to_slots", "test_slot_recipes.txt", 256)
+                if result is not True:
+                    self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                    print("TestRecipeSlotUpdates = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+            slotted_size = os.path.getsize("test_slot_recipes.txt")
+            if slotted_size < 2 * 256:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+
+            # Test an update that fits is written in place
+            result = safely_call_function(self.module_obj, "update_recipe", "Leafy Greens", "Nitrogen: 185 ppm\nEC Range: 1.7-2.1", "test_slot_recipes.txt")
+            if result is not True or os.path.getsize("test_slot_recipes.txt") != slotted_size:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+            result = safely_call_function(self.module_obj, "get_recipe", "Leafy Greens", "test_slot_recipes.txt")
+            if result is None or "EC Range: 1.7-2.1" not in result:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+
+            # Test an oversized update relocates the recipe to the end of the file
+            long_instructions = "\n".join(f"Step {i}: add nutrient mix" for i in range(30))
+            result = safely_call_function(self.module_obj, "update_recipe", "Leafy Greens", long_instructions, "test_slot_recipes.txt")
+            if result is not True or os.path.getsize("test_slot_recipes.txt") <= slotted_size:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+            grown_size = os.path.getsize("test_slot_recipes.txt")
+
+            # Test the old slot keeps its tombstoned header until compaction
+            with open("test_slot_recipes.txt", "r") as f:
+                content = f.read()
+            if content.count("Recipe: Leafy Greens") != 2:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+            result = safely_call_function(self.module_obj, "get_recipe", "Leafy Greens", "test_slot_recipes.txt")
+            if result is None or "Step 29: add nutrient mix" not in result:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+
+            # Test compaction reclaims the tombstoned slot and keeps every recipe
+            if check_function_exists(self.module_obj, "compact_recipes"):
+                result = safely_call_function(self.module_obj, "compact_recipes", "test_slot_recipes.txt")
+                if result is not True or os.path.getsize("test_slot_recipes.txt") >= grown_size:
+                    self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                    print("TestRecipeSlotUpdates = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+            with open("test_slot_recipes.txt", "r") as f:
+                content = f.read()
+            if content.count("Recipe: Leafy Greens") != 1 or "Nitrogen: 160 ppm" not in content:
+                self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+                print("TestRecipeSlotUpdates = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_slot_recipes.txt", "test_slot_recipes.txt.idx", "test_slot_recipes.txt.versions", "test_slot_recipes.txt.lock", "test_slot_recipes.txt.history", "test_slot_recipes.txt.history.idx"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestRecipeSlotUpdates", True, "functional")
+            print("TestRecipeSlotUpdates = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_slot_recipes.txt", "test_slot_recipes.txt.idx", "test_slot_recipes.txt.versions", "test_slot_recipes.txt.lock", "test_slot_recipes.txt.history", "test_slot_recipes.txt.history.idx"])
+            self.test_obj.yakshaAssert("TestRecipeSlotUpdates", False, "functional")
+            print("TestRecipeSlotUpdates = Failed")
+
+    def test_batch_recipe_updates(self):
+        """Test updating many recipes in one pass"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                print("TestBatchRecipeUpdates = Failed")
+                return
+
+            cleanup_test_files(["test_batch_recipes.txt.idx", "test_batch_recipes.txt.versions", "test_batch_recipes.txt.lock", "test_batch_recipes.txt.history", "test_batch_recipes.txt.history.idx"])
+
+            # Create a recipes file
+            try:
+                with open("test_batch_recipes.txt", "w") as f:
+                    f.write("Recipe: Leafy Greens\nNitrogen: 180 ppm\n\nRecipe: Tomatoes\nNitrogen: 160 ppm\n\nRecipe: Basil\nNitrogen: 150 ppm")
+            except Exception:
+                self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                print("TestBatchRecipeUpdates = Failed")
+                return
+
+            # Test a batch with known and unknown recipes
+            updates = {
+                "Leafy Greens": "Nitrogen: 185 ppm",
+                "Basil": "Nitrogen: 155 ppm",
+                "NonExistent Recipe": "Nitrogen: 1 ppm"
+            }
+            if check_function_exists(self.module_obj, "update_recipes"):
+                result = safely_call_function(self.module_obj, "update_recipes", updates, "test_batch_recipes.txt")
+                if result is None or not isinstance(result, dict):
+                    self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                    print("TestBatchRecipeUpdates = Failed")
+                    return
+                elif sorted(result.get("updated", [])) != ["Basil", "Leafy Greens"] or result.get("not_found") != ["NonExistent Recipe"]:
+                    self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                    print("TestBatchRecipeUpdates = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                print("TestBatchRecipeUpdates = Failed")
+                return
+
+            # Verify the file contents after the batch
+            try:
+                with open("test_batch_recipes.txt", "r") as f:
+                    content = f.read()
+            except Exception:
+                self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                print("TestBatchRecipeUpdates = Failed")
+                return
+            if ("Nitrogen: 185 ppm" not in content or "Nitrogen: 155 ppm" not in content or
+                    "Nitrogen: 160 ppm" not in content or "NonExistent Recipe" in content):
+                self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                print("TestBatchRecipeUpdates = Failed")
+                return
+
+            # Test an empty batch leaves the file unchanged
+            result = safely_call_function(self.module_obj, "update_recipes", {}, "test_batch_recipes.txt")
+            if result is None or result.get("updated") != []:
+                self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+                print("TestBatchRecipeUpdates = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_batch_recipes.txt", "test_batch_recipes.txt.idx", "test_batch_recipes.txt.versions", "test_batch_recipes.txt.lock", "test_batch_recipes.txt.history", "test_batch_recipes.txt.history.idx"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestBatchRecipeUpdates", True, "functional")
+            print("TestBatchRecipeUpdates = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_batch_recipes.txt", "test_batch_recipes.txt.idx", "test_batch_recipes.txt.versions", "test_batch_recipes.txt.lock", "test_batch_recipes.txt.history", "test_batch_recipes.txt.history.idx"])
+            self.test_obj.yakshaAssert("TestBatchRecipeUpdates", False, "functional")
+            print("TestBatchRecipeUpdates = Failed")
+
+    def test_concurrent_recipe_updates(self):
+        """Test locked, versioned recipe updates from several processes lose no updates"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                print("TestConcurrentRecipeUpdates = Failed")
+                return
+
+            workers = 4
+            iterations = 10
+            cleanup_test_files(["test_concurrent_recipes.txt.idx", "test_concurrent_recipes.txt.versions", "test_concurrent_recipes.txt.lock", "test_concurrent_recipes.txt.history", "test_concurrent_recipes.txt.history.idx"])
+
+            # Create a recipes file with a shared counter and one recipe per worker
+            try:
+                with open("test_concurrent_recipes.txt", "w") as f:
+                    blocks = ["Recipe: Counter\nCount: 0"]
+                    blocks += [f"Recipe: Worker {i}\nStep: none" for i in range(workers)]
+                    f.write("\n\n".join(blocks))
+            except Exception:
+                self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                print("TestConcurrentRecipeUpdates = Failed")
+                return
+
+            # Test a stale expected version is rejected
+            if check_function_exists(self.module_obj, "get_recipe_version") and hasattr(self.module_obj, "RecipeConflictError"):
+                version = safely_call_function(self.module_obj, "get_recipe_version", "Counter", "test_concurrent_recipes.txt")
+                if version is None or not isinstance(version, int):
+                    self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                    print("TestConcurrentRecipeUpdates = Failed")
+                    return
+                try:
+                    with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                        self.module_obj.update_recipe("Counter", "Count: 0", "test_concurrent_recipes.txt", expected_version=version + 1)
+                    self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                    print("TestConcurrentRecipeUpdates = Failed")
+                    return
+                except self.module_obj.RecipeConflictError:
+                    pass
+            else:
+                self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                print("TestConcurrentRecipeUpdates = Failed")
+                return
+
+            # Run the workers concurrently
+            try:
+                with multiprocessing.Pool(workers) as pool:
+                    jobs = [pool.apply_async(recipe_stress_worker, (i, iterations, "test_concurrent_recipes.txt")) for i in range(workers)]
+                    results = [job.get(timeout=120) for job in jobs]
+            except Exception:
+                self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                print("TestConcurrentRecipeUpdates = Failed")
+                return
+            if results != [True] * workers:
+                self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                print("TestConcurrentRecipeUpdates = Failed")
+                return
+
+            # Verify no update was lost or torn
+            result = safely_call_function(self.module_obj, "get_recipe", "Counter", "test_concurrent_recipes.txt")
+            if result is None or result.strip() != f"Count: {workers * iterations}":
+                self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                print("TestConcurrentRecipeUpdates = Failed")
+                return
+            for i in range(workers):
+                result = safely_call_function(self.module_obj, "get_recipe", f"Worker {i}", "test_concurrent_recipes.txt")
+                if result is None or result.strip() != f"Step: {iterations - 1}":
+                    self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                    print("TestConcurrentRecipeUpdates = Failed")
+                    return
+            with open("test_concurrent_recipes.txt", "r") as f:
+                if f.read().count("Recipe: ") != workers + 1:
+                    self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+                    print("TestConcurrentRecipeUpdates = Failed")
+                    return
+
+            # Clean up test files
+            cleanup_test_files(["test_concurrent_recipes.txt", "test_concurrent_recipes.txt.idx", "test_concurrent_recipes.txt.versions", "test_concurrent_recipes.txt.lock", "test_concurrent_recipes.txt.history", "test_concurrent_recipes.txt.history.idx"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", True, "functional")
+            print("TestConcurrentRecipeUpdates = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_concurrent_recipes.txt", "test_concurrent_recipes.txt.idx", "test_concurrent_recipes.txt.versions", "test_concurrent_recipes.txt.lock", "test_concurrent_recipes.txt.history", "test_concurrent_recipes.txt.history.idx"])
+            self.test_obj.yakshaAssert("TestConcurrentRecipeUpdates", False, "functional")
+            print("TestConcurrentRecipeUpdates = Failed")
+
+    def test_read_recipes_catalog(self):
+        """Test parsed recipe catalog with numeric values and cache refresh"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+
+            cleanup_test_files(["test_catalog_recipes.txt.idx", "test_catalog_recipes.txt.versions", "test_catalog_recipes.txt.lock", "test_catalog_recipes.txt.history", "test_catalog_recipes.txt.history.idx"])
+
+            # Create a recipes file
+            initial_recipes = """Recipe: Leafy Greens
+Nitrogen: 180 ppm
+Phosphorus: 50 ppm
+Potassium: 210 ppm
+EC Range: 1.6-2.0
+pH Range: 5.8-6.2
+
+Recipe: Tomatoes
+Nitrogen: 160 ppm
+Phosphorus: 60 ppm
+Potassium: 190 ppm
+EC Range: 2.0-3.5
+pH Range: 5.5-6.5"""
+            try:
+                with open("test_catalog_recipes.txt", "w") as f:
+                    f.write(initial_recipes)
+            except Exception:
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+
+            # Test parsed values are numeric
+            if check_function_exists(self.module_obj, "read_recipes"):
+                result = safely_call_function(self.module_obj, "read_recipes", "test_catalog_recipes.txt")
+                if result is None or not isinstance(result, list) or len(result) != 2:
+                    self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                    print("TestReadRecipesCatalog = Failed")
+                    return
+                tomatoes = [recipe for recipe in result if isinstance(recipe, dict) and recipe.get("name") == "Tomatoes"]
+                if len(tomatoes) != 1:
+                    self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                    print("TestReadRecipesCatalog = Failed")
+                    return
+                tomatoes = tomatoes[0]
+                if (tomatoes.get("nitrogen") != 160.0 or tomatoes.get("potassium") != 190.0 or
+                        tuple(tomatoes.get("ec_range", ())) != (2.0, 3.5) or tuple(tomatoes.get("ph_range", ())) != (5.5, 6.5)):
+                    self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                    print("TestReadRecipesCatalog = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+
+            # Test update_recipe refreshes the cached catalog
+            new_instructions = "Nitrogen: 170 ppm\nPhosphorus: 60 ppm\nPotassium: 190 ppm\nEC Range: 2.2-3.0\npH Range: 5.5-6.5"
+            if safely_call_function(self.module_obj, "update_recipe", "Tomatoes", new_instructions, "test_catalog_recipes.txt") is not True:
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+            result = safely_call_function(self.module_obj, "read_recipes", "test_catalog_recipes.txt")
+            tomatoes = [recipe for recipe in (result or []) if recipe.get("name") == "Tomatoes"]
+            if len(tomatoes) != 1 or tomatoes[0].get("nitrogen") != 170.0 or tuple(tomatoes[0].get("ec_range", ())) != (2.2, 3.0):
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+
+            # Test an external edit is picked up once the modification time changes
+            try:
+                with open("test_catalog_recipes.txt", "a") as f:
+                    f.write("\n\nRecipe: Basil\nNitrogen: 150 ppm\nPhosphorus: 40 ppm\nPotassium: 180 ppm\nEC Range: 1.0-1.6\npH Range: 5.5-6.5")
+                stat = os.stat("test_catalog_recipes.txt")
+                os.utime("test_catalog_recipes.txt", (stat.st_atime, stat.st_mtime + 5))
+            except Exception:
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+            result = safely_call_function(self.module_obj, "read_recipes", "test_catalog_recipes.txt")
+            if result is None or len(result) != 3:
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+
+            # Test missing file returns an empty list
+            result = safely_call_function(self.module_obj, "read_recipes", "nonexistent_recipes.txt")
+            if result is None or result != []:
+                self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+                print("TestReadRecipesCatalog = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_catalog_recipes.txt", "test_catalog_recipes.txt.idx", "test_catalog_recipes.txt.versions", "test_catalog_recipes.txt.lock", "test_catalog_recipes.txt.history", "test_catalog_recipes.txt.history.idx"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestReadRecipesCatalog", True, "functional")
+            print("TestReadRecipesCatalog = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_catalog_recipes.txt", "test_catalog_recipes.txt.idx", "test_catalog_recipes.txt.versions", "test_catalog_recipes.txt.lock", "test_catalog_recipes.txt.history", "test_catalog_recipes.txt.history.idx"])
+            self.test_obj.yakshaAssert("TestReadRecipesCatalog", False, "functional")
+            print("TestReadRecipesCatalog = Failed")
+
+    def test_recipe_history(self):
+        """Test append-only recipe history, point-in-time lookup and compaction"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+
+            cleanup_test_files(["test_history_recipes.txt", "test_history_recipes.txt.idx", "test_history_recipes.txt.versions", "test_history_recipes.txt.history", "test_history_recipes.txt.history.idx", "test_history_recipes.txt.lock"])
+
+            # Create a recipes file and record two changes a moment apart
+            try:
+                with open("test_history_recipes.txt", "w") as f:
+                    f.write("Recipe: Leafy Greens\nNitrogen: 180 ppm\n\nRecipe: Tomatoes\nNitrogen: 160 ppm\n\nRecipe: Basil\nNitrogen: 150 ppm")
+            except Exception:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+            time.sleep(1.1)
+            before_change = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            time.sleep(1.1)
+            if safely_call_function(self.module_obj, "update_recipe", "Leafy Greens", "Nitrogen: 185 ppm", "test_history_recipes.txt") is not True:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+            first_change = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            time.sleep(1.1)
+            if safely_call_function(self.module_obj, "update_recipe", "Leafy Greens", "Nitrogen: 190 ppm", "test_history_recipes.txt") is not True:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+
+            # Test point-in-time lookups
+            if check_function_exists(self.module_obj, "get_recipe_as_of"):
+                result = safely_call_function(self.module_obj, "get_recipe_as_of", "Leafy Greens", first_change, "test_history_recipes.txt")
+                if result is None or "Nitrogen: 185 ppm" not in result:
+                    self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                    print("TestRecipeHistory = Failed")
+                    return
+                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                result = safely_call_function(self.module_obj, "get_recipe_as_of", "Leafy Greens", now, "test_history_recipes.txt")
+                if result is None or "Nitrogen: 190 ppm" not in result:
+                    self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                    print("TestRecipeHistory = Failed")
+                    return
+                result = safely_call_function(self.module_obj, "get_recipe_as_of", "Leafy Greens", before_change, "test_history_recipes.txt")
+                if result is None or "Nitrogen: 180 ppm" not in result:
+                    self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                    print("TestRecipeHistory = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+
+            # Test a recipe that was never changed is answered from the recipes file
+            result = safely_call_function(self.module_obj, "get_recipe_as_of", "Basil", now, "test_history_recipes.txt")
+            if result is None or "Nitrogen: 150 ppm" not in result:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+
+            # Test batch updates are recorded in the history too
+            result = safely_call_function(self.module_obj, "update_recipes", {"Tomatoes": "Nitrogen: 165 ppm"}, "test_history_recipes.txt")
+            if result is None or result.get("updated") != ["Tomatoes"]:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            result = safely_call_function(self.module_obj, "get_recipe_as_of", "Tomatoes", now, "test_history_recipes.txt")
+            if result is None or "Nitrogen: 165 ppm" not in result:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+
+            # Test compaction rebuilds the current recipes and keeps the latest history
+            if check_function_exists(self.module_obj, "compact_recipe_history"):
+                if safely_call_function(self.module_obj, "compact_recipe_history", "test_history_recipes.txt", 0) is not True:
+                    self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                    print("TestRecipeHistory = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+            try:
+                with open("test_history_recipes.txt", "r") as f:
+                    content = f.read()
+            except Exception:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+            if ("Nitrogen: 190 ppm" not in content or "Nitrogen: 185 ppm" in content or
+                    "Recipe: Tomatoes" not in content or "Nitrogen: 165 ppm" not in content):
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+            result = safely_call_function(self.module_obj, "get_recipe_as_of", "Leafy Greens", datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "test_history_recipes.txt")
+            if result is None or "Nitrogen: 190 ppm" not in result:
+                self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+                print("TestRecipeHistory = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_history_recipes.txt", "test_history_recipes.txt.idx", "test_history_recipes.txt.versions", "test_history_recipes.txt.history", "test_history_recipes.txt.history.idx", "test_history_recipes.txt.lock"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestRecipeHistory", True, "functional")
+            print("TestRecipeHistory = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_history_recipes.txt", "test_history_recipes.txt.idx", "test_history_recipes.txt.versions", "test_history_recipes.txt.history", "test_history_recipes.txt.history.idx", "test_history_recipes.txt.lock"])
+            self.test_obj.yakshaAssert("TestRecipeHistory", False, "functional")
+            print("TestRecipeHistory = Failed")
+
+    def test_read_nutrient_columns(self):
+        """Test typed column parsing of nutrient levels with error reporting"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                print("TestReadNutrientColumns = Failed")
+                return
+
+            # Create a nutrient file with one invalid cell
+            try:
+                with open("test_columns_nutrients.csv", "w") as f:
+                    f.write("date,nitrogen,phosphorus,potassium,ec_level\n")
+                    f.write("2023-06-01,180,45,210,1.8\n")
+                    f.write("2023-06-02,abc,42,205,1.7\n")
+                    f.write("2023-06-03,175,44,208,1.9\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                print("TestReadNutrientColumns = Failed")
+                return
+
+            # Test typed list columns
+            if check_function_exists(self.module_obj, "read_nutrient_columns"):
+                result = safely_call_function(self.module_obj, "read_nutrient_columns", "test_columns_nutrients.csv")
+                if result is None or not isinstance(result, dict):
+                    self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                    print("TestReadNutrientColumns = Failed")
+                    return
+                columns = result.get("columns", {})
+                if columns.get("date") != ["2023-06-01", "2023-06-02", "2023-06-03"]:
+                    self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                    print("TestReadNutrientColumns = Failed")
+                    return
+                elif columns.get("potassium") != [210.0, 205.0, 208.0] or columns.get("ec_level") != [1.8, 1.7, 1.9]:
+                    self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                    print("TestReadNutrientColumns = Failed")
+                    return
+                elif len(columns.get("nitrogen", [])) != 3 or columns["nitrogen"][1] == columns["nitrogen"][1]:
+                    self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                    print("TestReadNutrientColumns = Failed")
+                    return
+                elif [tuple(error) for error in result.get("errors", [])] != [(3, "nitrogen", "abc")]:
+                    self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                    print("TestReadNutrientColumns = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                print("TestReadNutrientColumns = Failed")
+                return
+
+            # Test NumPy arrays when NumPy is available
+            try:
+                import numpy
+            except ImportError:
+                numpy = None
+            if numpy is not None:
+                result = safely_call_function(self.module_obj, "read_nutrient_columns", "test_columns_nutrients.csv", None, True)
+                if result is None or not isinstance(result.get("columns", {}).get("ec_level"), numpy.ndarray):
+                    self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                    print("TestReadNutrientColumns = Failed")
+                    return
+                elif abs(float(result["columns"]["ec_level"].sum()) - 5.4) > 0.001:
+                    self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                    print("TestReadNutrientColumns = Failed")
+                    return
+
+            # Test missing file returns empty columns
+            result = safely_call_function(self.module_obj, "read_nutrient_columns", "nonexistent_nutrients.csv")
+            if result is None or any(result.get("columns", {}).values()) or result.get("errors") != []:
+                self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+                print("TestReadNutrientColumns = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_columns_nutrients.csv"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestReadNutrientColumns", True, "functional")
+            print("TestReadNutrientColumns = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_columns_nutrients.csv"])
+            self.test_obj.yakshaAssert("TestReadNutrientColumns", False, "functional")
+            print("TestReadNutrientColumns = Failed")
+
+    def test_append_nutrient_readings_batch(self):
+        """Test batched nutrient appends with a single header"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+
+            cleanup_test_files(["test_batch_nutrients.csv", "test_batch_nutrients.csv.rolling"])
+
+            readings = [
+                {"date": "2023-06-01", "nitrogen": 180, "phosphorus": 45, "potassium": 210, "ec_level": 1.8},
+                {"date": "2023-06-02", "nitrogen": 175, "phosphorus": 42, "potassium": 205, "ec_level": 1.7},
+                {"date": "2023-06-03", "nitrogen": 178, "phosphorus": 44, "potassium": 208, "ec_level": 1.9}
+            ]
+
+            # Test two batches produce one header and all rows
+            if check_function_exists(self.module_obj, "append_nutrient_readings"):
+                for batch in [readings[:2], readings[2:]]:
+                    result = safely_call_function(self.module_obj, "append_nutrient_readings", batch, "test_batch_nutrients.csv")
+                    if result is None or result is not True:
+                        self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                        print("TestAppendNutrientReadingsBatch = Failed")
+                        return
+            else:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+            try:
+                with open("test_batch_nutrients.csv", "r") as f:
+                    lines = f.readlines()
+            except Exception:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+            if len(lines) != 4 or "date,nitrogen,phosphorus,potassium,ec_level" not in lines[0] or "2023-06-03,178,44,208,1.9" not in lines[3]:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+
+            # Test a deleted and recreated file gets its header written again
+            # (the inode number may be reused, so size/mtime must invalidate the cache)
+            cleanup_test_files(["test_batch_nutrients.csv", "test_batch_nutrients.csv.rolling"])
+            result = safely_call_function(self.module_obj, "append_nutrient_readings", readings[:1], "test_batch_nutrients.csv")
+            try:
+                with open("test_batch_nutrients.csv", "r") as f:
+                    lines = f.readlines()
+            except Exception:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+            if result is not True or len(lines) != 2 or "date,nitrogen,phosphorus,potassium,ec_level" not in lines[0]:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+
+            # Test a file rewritten in place with a mismatched header is rejected
+            try:
+                with open("test_batch_nutrients.csv", "w") as f:
+                    f.write("date,ec_level,nitrogen\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+            if safely_call_function(self.module_obj, "append_nutrient_readings", readings, "test_batch_nutrients.csv") is not False:
+                self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+                print("TestAppendNutrientReadingsBatch = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_batch_nutrients.csv", "test_batch_nutrients.csv.rolling"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", True, "functional")
+            print("TestAppendNutrientReadingsBatch = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_batch_nutrients.csv", "test_batch_nutrients.csv.rolling"])
+            self.test_obj.yakshaAssert("TestAppendNutrientReadingsBatch", False, "functional")
+            print("TestAppendNutrientReadingsBatch = Failed")
+
+    def test_rolling_nutrient_stats(self):
+        """Test rolling nutrient statistics maintained on append and rebuilt from the CSV"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                print("TestRollingNutrientStats = Failed")
+                return
+
+            cleanup_test_files(["test_rolling_nutrients.csv", "test_rolling_nutrients.csv.rolling"])
+
+            # Append readings one by one
+            for day, nitrogen in enumerate([170, 180, 160, 190, 200], start=1):
+                reading = {"date": f"2023-06-0{day}", "nitrogen": nitrogen, "phosphorus": 45, "potassium": 210, "ec_level": 1.5 + day / 10}
+                if safely_call_function(self.module_obj, "append_nutrient_reading", reading, "test_rolling_nutrients.csv") is not True:
+                    self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                    print("TestRollingNutrientStats = Failed")
+                    return
+
+            # Test the rebuilt state tracks a window of 3 readings
+            if check_function_exists(self.module_obj, "rebuild_nutrient_stats"):
+                if safely_call_function(self.module_obj, "rebuild_nutrient_stats", "test_rolling_nutrients.csv", (3, 7)) is not True:
+                    self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                    print("TestRollingNutrientStats = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                print("TestRollingNutrientStats = Failed")
+                return
+            if check_function_exists(self.module_obj, "nutrient_stats"):
+                result = safely_call_function(self.module_obj, "nutrient_stats", 3, "test_rolling_nutrients.csv")
+                if result is None or not isinstance(result, dict) or "nitrogen" not in result:
+                    self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                    print("TestRollingNutrientStats = Failed")
+                    return
+                nitrogen = result["nitrogen"]
+                if abs(nitrogen.get("mean", 0) - 550 / 3) > 0.001 or nitrogen.get("min") != 160 or nitrogen.get("max") != 200:
+                    self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                    print("TestRollingNutrientStats = Failed")
+                    return
+                elif abs(nitrogen.get("trend", 0) - 40) > 0.001 or abs(result["ec_level"].get("max", 0) - 2.0) > 0.001:
+                    self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                    print("TestRollingNutrientStats = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                print("TestRollingNutrientStats = Failed")
+                return
+
+            # Test appends after a rebuild keep the windows up to date
+            reading = {"date": "2023-06-06", "nitrogen": 150, "phosphorus": 45, "potassium": 210, "ec_level": 1.6}
+            if safely_call_function(self.module_obj, "append_nutrient_reading", reading, "test_rolling_nutrients.csv") is not True:
+                self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                print("TestRollingNutrientStats = Failed")
+                return
+            result = safely_call_function(self.module_obj, "nutrient_stats", 3, "test_rolling_nutrients.csv")
+            if result is None or result["nitrogen"].get("min") != 150 or result["nitrogen"].get("max") != 200:
+                self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                print("TestRollingNutrientStats = Failed")
+                return
+            result = safely_call_function(self.module_obj, "nutrient_stats", 7, "test_rolling_nutrients.csv")
+            if result is None or abs(result["nitrogen"].get("mean", 0) - 175) > 0.001:
+                self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+                print("TestRollingNutrientStats = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_rolling_nutrients.csv", "test_rolling_nutrients.csv.rolling"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestRollingNutrientStats", True, "functional")
+            print("TestRollingNutrientStats = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_rolling_nutrients.csv", "test_rolling_nutrients.csv.rolling"])
+            self.test_obj.yakshaAssert("TestRollingNutrientStats", False, "functional")
+            print("TestRollingNutrientStats = Failed")
+
+    def test_columnar_nutrient_store(self):
+        """Test column-per-file nutrient store appends and selective column reads"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                print("TestColumnarNutrientStore = Failed")
+                return
+
+            shutil.rmtree("test_nutrient_store", ignore_errors=True)
+            cleanup_test_files(["test_store_nutrients.csv", "test_store_nutrients.csv.rolling"])
+
+            # Append readings to the CSV and the columnar store
+            readings = [
+                {"date": "2023-06-01", "nitrogen": 180, "phosphorus": 45, "potassium": 210, "ec_level": 1.8},
+                {"date": "2023-06-02", "nitrogen": 175, "phosphorus": 42, "potassium": 205, "ec_level": 1.7},
+                {"date": "2023-06-02 14:30", "nitrogen": 176, "phosphorus": 43, "potassium": 206, "ec_level": 1.9},
+                {"date": "2023-06-03 08:15:45", "nitrogen": 178, "phosphorus": 44, "potassium": 208, "ec_level": 2.0}
+            ]
+            for reading in readings:
+                result = safely_call_function(self.module_obj, "append_nutrient_reading", reading, "test_store_nutrients.csv", "test_nutrient_store")
+                if result is None or result is not True:
+                    self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                    print("TestColumnarNutrientStore = Failed")
+                    return
+            for name in ["manifest.json", "date.bin", "date_format.bin", "nitrogen.bin", "phosphorus.bin", "potassium.bin", "ec_level.bin"]:
+                if not os.path.exists(os.path.join("test_nutrient_store", name)):
+                    self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                    print("TestColumnarNutrientStore = Failed")
+                    return
+
+            # Test reading a single column
+            if check_function_exists(self.module_obj, "read_nutrient_store"):
+                result = safely_call_function(self.module_obj, "read_nutrient_store", "test_nutrient_store", ["ec_level"])
+                if result is None or not isinstance(result, dict) or list(result.keys()) != ["ec_level"]:
+                    self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                    print("TestColumnarNutrientStore = Failed")
+                    return
+                elif [round(value, 3) for value in result["ec_level"]] != [1.8, 1.7, 1.9, 2.0]:
+                    self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                    print("TestColumnarNutrientStore = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                print("TestColumnarNutrientStore = Failed")
+                return
+
+            # Test reading every column, with dates returned in their original format
+            result = safely_call_function(self.module_obj, "read_nutrient_store", "test_nutrient_store")
+            if result is None or list(result.get("date", [])) != [reading["date"] for reading in readings]:
+                self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                print("TestColumnarNutrientStore = Failed")
+                return
+            elif list(result.get("potassium", [])) != [210.0, 205.0, 206.0, 208.0]:
+                self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                print("TestColumnarNutrientStore = Failed")
+                return
+
+            # Test a missing store returns no columns
+            result = safely_call_function(self.module_obj, "read_nutrient_store", "nonexistent_store")
+            if result is None or result != {}:
+                self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+                print("TestColumnarNutrientStore = Failed")
+                return
+
+            shutil.rmtree("test_nutrient_store", ignore_errors=True)
+
+            # Clean up test files
+            cleanup_test_files(["test_store_nutrients.csv", "test_store_nutrients.csv.rolling"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestColumnarNutrientStore", True, "functional")
+            print("TestColumnarNutrientStore = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_store_nutrients.csv", "test_store_nutrients.csv.rolling"])
+            self.test_obj.yakshaAssert("TestColumnarNutrientStore", False, "functional")
+            print("TestColumnarNutrientStore = Failed")
+
+    def test_join_sensor_nutrients(self):
+        """Test inner, left and as-of joins of sensor and nutrient readings"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+                print("TestJoinSensorNutrients = Failed")
+                return
+
+            # Create sorted sensor and nutrient files plus an unsorted nutrient file
+            try:
+                with open("test_join_sensor.txt", "w") as f:
+                    for day in ["01", "02", "03", "05"]:
+                        f.write(f"2023-06-{day},24.5,65.2,6.2,22000\n")
+                nutrient_rows = {"01": "180,45,210,1.8", "03": "175,42,205,1.7", "04": "178,44,208,1.9"}
+                with open("test_join_nutrients.csv", "w") as f:
+                    f.write("date,nitrogen,phosphorus,potassium,ec_level\n")
+                    for day in ["01", "03", "04"]:
+                        f.write(f"2023-06-{day},{nutrient_rows[day]}\n")
+                with open("test_join_unsorted.csv", "w") as f:
+                    f.write("date,nitrogen,phosphorus,potassium,ec_level\n")
+                    for day in ["04", "01", "03"]:
+                        f.write(f"2023-06-{day},{nutrient_rows[day]}\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+                print("TestJoinSensorNutrients = Failed")
+                return
+
+            def run_join(nutrient_file, how):
+                result = safely_call_function(self.module_obj, "join_sensor_nutrients", "test_join_sensor.txt", nutrient_file, how)
+                try:
+                    return [(row["date"], row["nitrogen"]) for row in result]
+                except Exception:
+                    return None
+
+            if not check_function_exists(self.module_obj, "join_sensor_nutrients"):
+                self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+                print("TestJoinSensorNutrients = Failed")
+                return
+
+            # Test each join type on sorted input
+            if run_join("test_join_nutrients.csv", "inner") != [("2023-06-01", 180.0), ("2023-06-03", 175.0)]:
+                self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+                print("TestJoinSensorNutrients = Failed")
+                return
+            if run_join("test_join_nutrients.csv", "left") != [("2023-06-01", 180.0), ("2023-06-02", None), ("2023-06-03", 175.0), ("2023-06-05", None)]:
+                self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+                print("TestJoinSensorNutrients = Failed")
+                return
+            if run_join("test_join_nutrients.csv", "asof") != [("2023-06-01", 180.0), ("2023-06-02", 180.0), ("2023-06-03", 175.0), ("2023-06-05", 178.0)]:
+                self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+                print("TestJoinSensorNutrients = Failed")
+                return
+
+            # Test unsorted input falls back to the same results
+            for how in ["inner", "left", "asof"]:
+                if run_join("test_join_unsorted.csv", how) != run_join("test_join_nutrients.csv", how):
+                    self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+                    print("TestJoinSensorNutrients = Failed")
+                    return
+
+            # Clean up test files
+            cleanup_test_files(["test_join_sensor.txt", "test_join_nutrients.csv", "test_join_unsorted.csv"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestJoinSensorNutrients", True, "functional")
+            print("TestJoinSensorNutrients = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_join_sensor.txt", "test_join_nutrients.csv", "test_join_unsorted.csv"])
+            self.test_obj.yakshaAssert("TestJoinSensorNutrients", False, "functional")
+            print("TestJoinSensorNutrients = Failed")
+
+    def test_resample_readings(self):
+        """Test single-pass resampling of minute-level readings"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+
+            # Create minute-level sensor data over two days
+            try:
+                with open("test_minute_sensor.txt", "w") as f:
+                    for day, base in [("2023-06-01", 20.0), ("2023-06-02", 30.0)]:
+                        for hour in [10, 11]:
+                            for minute in range(3):
+                                f.write(f"{day} {hour}:{minute:02d},{base + minute},60.0,6.0,20000\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+
+            # Test daily buckets
+            if check_function_exists(self.module_obj, "resample_readings") and check_function_exists(self.module_obj, "iter_sensor_data"):
+                records = safely_call_function(self.module_obj, "iter_sensor_data", "test_minute_sensor.txt")
+                try:
+                    buckets = list(safely_call_function(self.module_obj, "resample_readings", records, "day", ["temperature"]))
+                except Exception:
+                    self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                    print("TestResampleReadings = Failed")
+                    return
+                if len(buckets) != 2 or buckets[0].get("count") != 6 or buckets[1].get("count") != 6:
+                    self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                    print("TestResampleReadings = Failed")
+                    return
+                elif abs(buckets[0].get("temperature_mean", 0) - 21.0) > 0.001 or buckets[1].get("temperature_max") != 32.0:
+                    self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                    print("TestResampleReadings = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+
+            # Test hourly and weekly buckets
+            records = safely_call_function(self.module_obj, "iter_sensor_data", "test_minute_sensor.txt")
+            try:
+                hourly = list(safely_call_function(self.module_obj, "resample_readings", records, "hour", ["temperature"]))
+            except Exception:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+            if len(hourly) != 4 or any(bucket.get("count") != 3 for bucket in hourly) or hourly[2].get("temperature_min") != 30.0:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+            records = safely_call_function(self.module_obj, "iter_sensor_data", "test_minute_sensor.txt")
+            try:
+                weekly = list(safely_call_function(self.module_obj, "resample_readings", records, "week"))
+            except Exception:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+            if len(weekly) != 1 or weekly[0].get("count") != 12 or abs(weekly[0].get("humidity_mean", 0) - 60.0) > 0.001:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+
+            # Test writing a downsampled file
+            if check_function_exists(self.module_obj, "save_resampled"):
+                records = safely_call_function(self.module_obj, "iter_sensor_data", "test_minute_sensor.txt")
+                if safely_call_function(self.module_obj, "save_resampled", records, "test_resampled.csv", "hour") is not True:
+                    self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                    print("TestResampleReadings = Failed")
+                    return
+                with open("test_resampled.csv", "r") as f:
+                    lines = f.readlines()
+                if len(lines) != 5 or "period" not in lines[0] or "temperature_mean" not in lines[0]:
+                    self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                    print("TestResampleReadings = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+
+            # Test the weekly report can list daily buckets
+            if safely_call_function(self.module_obj, "generate_weekly_report", "test_minute_sensor.txt", "test_resampled_report.txt", "day") is not True:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+            with open("test_resampled_report.txt", "r") as f:
+                content = f.read()
+            if "DAILY READINGS:" not in content or "2023-06-01" not in content or "10:01" in content:
+                self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+                print("TestResampleReadings = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_minute_sensor.txt", "test_resampled.csv", "test_resampled_report.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestResampleReadings", True, "functional")
+            print("TestResampleReadings = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_minute_sensor.txt", "test_resampled.csv", "test_resampled_report.txt"])
+            self.test_obj.yakshaAssert("TestResampleReadings", False, "functional")
+            print("TestResampleReadings = Failed")
+
+    def test_threshold_alerts(self):
+        """Test recipe-driven threshold alerts with debounced batched logging"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            cleanup_test_files(["test_alert_log.txt", "test_alert_log.txt.stats", "test_alert_log.txt.alerts", "test_alert_span_log.txt", "test_alert_span_log.txt.stats", "test_alert_span_log.txt.alerts", "test_alert_bounds_log.txt", "test_alert_bounds_log.txt.stats", "test_alert_bounds_log.txt.alerts"])
+
+            # Create a recipe with EC and pH ranges
+            try:
+                with open("test_alert_recipes.txt", "w") as f:
+                    f.write("Recipe: Leafy Greens\nNitrogen: 180 ppm\nPhosphorus: 50 ppm\nPotassium: 210 ppm\nEC Range: 1.6-2.0\npH Range: 5.8-6.2")
+            except Exception:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            # Sustained heat over three readings, one pH excursion and one EC excursion
+            sensor_readings = []
+            for day, temperature, ph_level in [("01", 24.0, 6.0), ("02", 31.0, 6.0), ("03", 33.0, 6.5), ("04", 32.0, 6.0), ("05", 25.0, 6.1)]:
+                sensor_readings.append({"date": f"2023-06-{day}", "temperature": temperature, "humidity": 65.0, "ph_level": ph_level, "light_level": 22000})
+            nutrient_readings = [
+                {"date": "2023-06-01", "nitrogen": 180.0, "phosphorus": 45.0, "potassium": 210.0, "ec_level": 1.8},
+                {"date": "2023-06-02", "nitrogen": 180.0, "phosphorus": 45.0, "potassium": 210.0, "ec_level": 2.4}
+            ]
+
+            # Test the excursions found
+            if check_function_exists(self.module_obj, "check_alerts"):
+                result = safely_call_function(self.module_obj, "check_alerts", sensor_readings, nutrient_readings, "Leafy Greens",
+                                              "test_alert_recipes.txt", None, "test_alert_log.txt")
+                if result is None or not isinstance(result, list) or len(result) != 3:
+                    self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                    print("TestThresholdAlerts = Failed")
+                    return
+                excursions = {excursion.get("field"): excursion for excursion in result}
+                temperature = excursions.get("temperature", {})
+                if temperature.get("start") != "2023-06-02" or temperature.get("end") != "2023-06-04" or temperature.get("value") != 33.0:
+                    self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                    print("TestThresholdAlerts = Failed")
+                    return
+                elif excursions.get("ph_level", {}).get("start") != "2023-06-03" or excursions.get("ec_level", {}).get("value") != 2.4:
+                    self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                    print("TestThresholdAlerts = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            # Test each excursion is logged once
+            result = safely_call_function(self.module_obj, "search_logs", "alert", "test_alert_log.txt")
+            if result is None or len(result) != 3:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            # Test an excursion spanning two batches is logged once
+            first_batch = [dict(reading, date=reading["date"].replace("-06-", "-07-")) for reading in sensor_readings[:2]]
+            second_batch = [dict(reading, date=reading["date"].replace("-06-", "-07-")) for reading in sensor_readings[2:]]
+            bounds = {"temperature": (0.0, 30.0)}
+            for batch in [first_batch, second_batch]:
+                result = safely_call_function(self.module_obj, "check_alerts", batch, [], "Leafy Greens",
+                                              "test_alert_recipes.txt", bounds, "test_alert_span_log.txt")
+                if result is None:
+                    self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                    print("TestThresholdAlerts = Failed")
+                    return
+            temperature = [excursion for excursion in result if excursion.get("field") == "temperature"]
+            if len(temperature) != 1 or temperature[0].get("continued") is not True or temperature[0].get("start") != "2023-07-02":
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+            result = safely_call_function(self.module_obj, "search_logs", "temperature", "test_alert_span_log.txt")
+            if result is None or len(result) != 1:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            # Test an older backfill batch submitted afterwards still raises its alerts
+            result = safely_call_function(self.module_obj, "check_alerts", sensor_readings, [], "Leafy Greens",
+                                          "test_alert_recipes.txt", bounds, "test_alert_span_log.txt")
+            temperature = [excursion for excursion in result or [] if excursion.get("field") == "temperature"]
+            if len(temperature) != 1 or temperature[0].get("continued") is not False or temperature[0].get("start") != "2023-06-02":
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+            result = safely_call_function(self.module_obj, "search_logs", "temperature", "test_alert_span_log.txt")
+            if result is None or len(result) != 2:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            # Test custom bounds replace the defaults
+            result = safely_call_function(self.module_obj, "check_alerts", sensor_readings, [], "Leafy Greens",
+                                          "test_alert_recipes.txt", {"temperature": (0.0, 40.0)}, "test_alert_bounds_log.txt")
+            if result is None or [excursion.get("field") for excursion in result] != ["ph_level"]:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            # Test batched logging directly
+            if check_function_exists(self.module_obj, "log_system_events"):
+                events = [("Alert", "Batch one"), ("Alert", "Batch two")]
+                if safely_call_function(self.module_obj, "log_system_events", events, "test_alert_log.txt") is not True:
+                    self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                    print("TestThresholdAlerts = Failed")
+                    return
+                result = safely_call_function(self.module_obj, "search_logs", "batch", "test_alert_log.txt")
+                if result is None or [entry.get("message") for entry in result] != ["Batch one", "Batch two"]:
+                    self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                    print("TestThresholdAlerts = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+                print("TestThresholdAlerts = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_alert_recipes.txt", "test_alert_log.txt", "test_alert_log.txt.stats", "test_alert_log.txt.alerts", "test_alert_span_log.txt", "test_alert_span_log.txt.stats", "test_alert_span_log.txt.alerts", "test_alert_bounds_log.txt", "test_alert_bounds_log.txt.stats", "test_alert_bounds_log.txt.alerts"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestThresholdAlerts", True, "functional")
+            print("TestThresholdAlerts = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_alert_recipes.txt", "test_alert_log.txt", "test_alert_log.txt.stats", "test_alert_log.txt.alerts", "test_alert_span_log.txt", "test_alert_span_log.txt.stats", "test_alert_span_log.txt.alerts", "test_alert_bounds_log.txt", "test_alert_bounds_log.txt.stats", "test_alert_bounds_log.txt.alerts"])
+            self.test_obj.yakshaAssert("TestThresholdAlerts", False, "functional")
+            print("TestThresholdAlerts = Failed")
+
+    def test_streaming_report_aggregation(self):
+        """Test single-pass Welford report aggregation over many readings"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+
+            # Build a large sensor file
+            readings = []
+            start = datetime(2023, 6, 1)
+            for i in range(5000):
+                readings.append({
+                    "date": (start + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M"),
+                    "temperature": 20.0 + (i % 10),
+                    "humidity": 60.0 + (i % 7),
+                    "ph_level": 5.8 + (i % 5) / 10,
+                    "light_level": 20000 + (i % 11) * 100
+                })
+            if safely_call_function(self.module_obj, "save_daily_readings", readings, "test_stream_data.txt") is not True:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+
+            # Test the running aggregate matches exact statistics
+            if check_function_exists(self.module_obj, "new_report_stats") and check_function_exists(self.module_obj, "update_report_stats"):
+                stats = safely_call_function(self.module_obj, "new_report_stats")
+                for reading in readings:
+                    stats = safely_call_function(self.module_obj, "update_report_stats", stats, reading)
+                if stats is None or stats.get("count") != 5000 or stats.get("first_date") != readings[0]["date"] or stats.get("last_date") != readings[-1]["date"]:
+                    self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                    print("TestStreamingReportAggregation = Failed")
+                    return
+                temperatures = [reading["temperature"] for reading in readings]
+                temperature = stats.get("temperature", {})
+                if abs(temperature.get("mean", 0) - statistics.mean(temperatures)) > 1e-9:
+                    self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                    print("TestStreamingReportAggregation = Failed")
+                    return
+                elif abs(temperature.get("m2", 0) / (temperature.get("count", 1) - 1) - statistics.variance(temperatures)) > 1e-6:
+                    self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                    print("TestStreamingReportAggregation = Failed")
+                    return
+                elif temperature.get("min") != 20.0 or temperature.get("max") != 29.0:
+                    self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                    print("TestStreamingReportAggregation = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+
+            # Test the streamed report has the averages before every daily line
+            if safely_call_function(self.module_obj, "generate_weekly_report", "test_stream_data.txt", "test_stream_report.txt") is not True:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+            try:
+                with open("test_stream_report.txt", "r") as f:
+                    content = f.read()
+            except Exception:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+            averages_at = content.find("AVERAGES:")
+            daily_at = content.find("DAILY READINGS:")
+            if averages_at == -1 or daily_at == -1 or averages_at > daily_at:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+            import re
+            temp_match = re.search(r"Temperature:\s*([\d.]+)", content)
+            if temp_match is None or abs(float(temp_match.group(1)) - statistics.mean(temperatures)) > 0.01:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+            if readings[0]["date"] not in content or readings[-1]["date"] not in content:
+                self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+                print("TestStreamingReportAggregation = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_stream_data.txt", "test_stream_report.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestStreamingReportAggregation", True, "functional")
+            print("TestStreamingReportAggregation = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_stream_data.txt", "test_stream_report.txt"])
+            self.test_obj.yakshaAssert("TestStreamingReportAggregation", False, "functional")
+            print("TestStreamingReportAggregation = Failed")
+
+    def test_incremental_weekly_report(self):
+        """Test incremental report regeneration and full rebuild after a rewrite"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+
+            import re
+            cleanup_test_files(["test_incremental_report.txt", "test_incremental_report.txt.state"])
+
+            def reported_temperature():
+                try:
+                    with open("test_incremental_report.txt", "r") as f:
+                        content = f.read()
+                    return content, float(re.search(r"Temperature:\s*([\d.]+)", content).group(1))
+                except Exception:
+                    return "", None
+
+            # Generate an incremental report from an initial file
+            try:
+                with open("test_incremental_data.txt", "w") as f:
+                    f.write("2023-06-01,24.0,60.0,6.0,20000\n2023-06-02,26.0,70.0,6.2,22000\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+            if safely_call_function(self.module_obj, "generate_weekly_report", "test_incremental_data.txt", "test_incremental_report.txt", None, True) is not True:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+            if not os.path.exists("test_incremental_report.txt.state"):
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+
+            # Test appended readings are folded into the saved aggregate
+            try:
+                with open("test_incremental_data.txt", "a") as f:
+                    f.write("2023-06-03,28.0,65.0,6.1,21000\n")
+            except Exception:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+            if safely_call_function(self.module_obj, "generate_weekly_report", "test_incremental_data.txt", "test_incremental_report.txt", None, True) is not True:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+            content, temperature = reported_temperature()
+            if temperature is None or abs(temperature - 26.0) > 0.01 or "2023-06-01" not in content or "2023-06-03" not in content:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+
+            # Test a rewritten source forces a full rebuild
+            rewritten = [
+                {"date": "2023-07-01", "temperature": 20.0, "humidity": 60.0, "ph_level": 6.0, "light_level": 20000},
+                {"date": "2023-07-02", "temperature": 22.0, "humidity": 60.0, "ph_level": 6.0, "light_level": 20000},
+                {"date": "2023-07-03", "temperature": 24.0, "humidity": 60.0, "ph_level": 6.0, "light_level": 20000},
+                {"date": "2023-07-04", "temperature": 26.0, "humidity": 60.0, "ph_level": 6.0, "light_level": 20000}
+            ]
+            if safely_call_function(self.module_obj, "save_daily_readings", rewritten, "test_incremental_data.txt") is not True:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+            if safely_call_function(self.module_obj, "generate_weekly_report", "test_incremental_data.txt", "test_incremental_report.txt", None, True) is not True:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+            content, temperature = reported_temperature()
+            if temperature is None or abs(temperature - 23.0) > 0.01 or "2023-06-01" in content or "2023-07-04" not in content:
+                self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+                print("TestIncrementalWeeklyReport = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_incremental_data.txt", "test_incremental_report.txt", "test_incremental_report.txt.state"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", True, "functional")
+            print("TestIncrementalWeeklyReport = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_incremental_data.txt", "test_incremental_report.txt", "test_incremental_report.txt.state"])
+            self.test_obj.yakshaAssert("TestIncrementalWeeklyReport", False, "functional")
+            print("TestIncrementalWeeklyReport = Failed")
+
+    def test_multi_period_reports(self):
+        """Test daily, weekly and monthly reports from one scan"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                print("TestMultiPeriodReports = Failed")
+                return
+
+            # Build 40 days of readings spanning two months
+            readings = []
+            start = datetime(2023, 6, 1)
+            for i in range(40):
+                readings.append({
+                    "date": (start + timedelta(days=i)).strftime("%Y-%m-%d"),
+                    "temperature": 20.0 if i < 30 else 30.0,
+                    "humidity": 65.0,
+                    "ph_level": 6.0,
+                    "light_level": 22000
+                })
+            if safely_call_function(self.module_obj, "save_daily_readings", readings, "test_period_data.txt") is not True:
+                self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                print("TestMultiPeriodReports = Failed")
+                return
+
+            outputs = {"daily": "test_period_daily.txt", "weekly": "test_period_weekly.txt", "monthly": "test_period_monthly.txt"}
+            if check_function_exists(self.module_obj, "generate_period_reports"):
+                if safely_call_function(self.module_obj, "generate_period_reports", "test_period_data.txt", outputs) is not True:
+                    self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                    print("TestMultiPeriodReports = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                print("TestMultiPeriodReports = Failed")
+                return
+
+            # Test each report has one AVERAGES section per period
+            contents = {}
+            try:
+                for period, path in outputs.items():
+                    with open(path, "r") as f:
+                        contents[period] = f.read()
+            except Exception:
+                self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                print("TestMultiPeriodReports = Failed")
+                return
+            if contents["daily"].count("AVERAGES:") != 40 or contents["weekly"].count("AVERAGES:") != 7 or contents["monthly"].count("AVERAGES:") != 2:
+                self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                print("TestMultiPeriodReports = Failed")
+                return
+
+            # Test the monthly averages are computed per month
+            import re
+            temperatures = [float(value) for value in re.findall(r"Temperature:\s*([\d.]+)", contents["monthly"])]
+            if len(temperatures) != 2 or abs(temperatures[0] - 20.0) > 0.01 or abs(temperatures[1] - 30.0) > 0.01:
+                self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                print("TestMultiPeriodReports = Failed")
+                return
+            for field in ["Humidity:", "pH Level:", "Light Level:"]:
+                if contents["monthly"].count(field) != 2:
+                    self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+                    print("TestMultiPeriodReports = Failed")
+                    return
+
+            # Clean up test files
+            cleanup_test_files(["test_period_data.txt", "test_period_daily.txt", "test_period_weekly.txt", "test_period_monthly.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestMultiPeriodReports", True, "functional")
+            print("TestMultiPeriodReports = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_period_data.txt", "test_period_daily.txt", "test_period_weekly.txt", "test_period_monthly.txt"])
+            self.test_obj.yakshaAssert("TestMultiPeriodReports", False, "functional")
+            print("TestMultiPeriodReports = Failed")
+
+    def test_report_percentile_sketches(self):
+        """Test mergeable quantile sketches in the report aggregate"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+
+            # Build readings with a spike in the upper tail
+            readings = []
+            for i in range(10000):
+                temperature = 20.0 + (i * 7919 % 1000) / 100
+                if i % 100 == 0:
+                    temperature = 40.0
+                readings.append({"date": "2023-06-01", "temperature": temperature, "humidity": 65.0, "ph_level": 6.0, "light_level": 22000})
+            exact = sorted(reading["temperature"] for reading in readings)
+
+            def aggregate(part):
+                stats = safely_call_function(self.module_obj, "new_report_stats")
+                for reading in part:
+                    stats = safely_call_function(self.module_obj, "update_report_stats", stats, reading)
+                return stats
+
+            if not (check_function_exists(self.module_obj, "report_percentile") and check_function_exists(self.module_obj, "merge_report_stats")):
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+
+            # Test percentiles from a single aggregate are close to the exact ones
+            whole = aggregate(readings)
+            for percentile in [50, 95]:
+                estimate = safely_call_function(self.module_obj, "report_percentile", whole, "temperature", percentile)
+                if estimate is None or abs(estimate - exact[int(len(exact) * percentile / 100) - 1]) > 0.5:
+                    self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                    print("TestReportPercentileSketches = Failed")
+                    return
+
+            # Test the spike shows up in the upper tail
+            estimate = safely_call_function(self.module_obj, "report_percentile", whole, "temperature", 99.9)
+            if estimate is None or estimate < 39.5:
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+
+            # Test the sketch stays bounded
+            if whole is None or len(whole.get("temperature", {}).get("sketch", [])) > 10 * 100:
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+
+            # Test merged partitions give the same statistics
+            merged = safely_call_function(self.module_obj, "merge_report_stats", aggregate(readings[:3000]), aggregate(readings[3000:]))
+            if merged is None or merged.get("count") != 10000:
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+            if abs(merged["temperature"]["mean"] - whole["temperature"]["mean"]) > 1e-9 or abs(merged["temperature"]["m2"] - whole["temperature"]["m2"]) > 1e-6:
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+            for percentile in [50, 95]:
+                estimate = safely_call_function(self.module_obj, "report_percentile", merged, "temperature", percentile)
+                if estimate is None or abs(estimate - exact[int(len(exact) * percentile / 100) - 1]) > 0.5:
+                    self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                    print("TestReportPercentileSketches = Failed")
+                    return
+
+            # Test the report includes the percentiles section
+            if safely_call_function(self.module_obj, "save_daily_readings", readings[:500], "test_sketch_data.txt") is not True:
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+            if safely_call_function(self.module_obj, "generate_weekly_report", "test_sketch_data.txt", "test_sketch_report.txt") is not True:
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+            with open("test_sketch_report.txt", "r") as f:
+                content = f.read()
+            if "PERCENTILES:" not in content or content.find("AVERAGES:") > content.find("PERCENTILES:"):
+                self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+                print("TestReportPercentileSketches = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_sketch_data.txt", "test_sketch_report.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestReportPercentileSketches", True, "functional")
+            print("TestReportPercentileSketches = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_sketch_data.txt", "test_sketch_report.txt"])
+            self.test_obj.yakshaAssert("TestReportPercentileSketches", False, "functional")
+            print("TestReportPercentileSketches = Failed")
+
+    def test_parallel_zone_reports(self):
+        """Test parallel per-zone reports and the merged fleet summary"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                print("TestParallelZoneReports = Failed")
+                return
+
+            import re
+
+            # Create one sensor file per zone
+            jobs = []
+            all_temperatures = []
+            for zone in range(3):
+                readings = []
+                for day in range(1, 8):
+                    temperature = 20.0 + zone * 2 + day / 10
+                    all_temperatures.append(temperature)
+                    readings.append({"date": f"2023-06-0{day}", "temperature": temperature, "humidity": 65.0, "ph_level": 6.0, "light_level": 22000})
+                if safely_call_function(self.module_obj, "save_daily_readings", readings, f"test_zone{zone}_data.txt") is not True:
+                    self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                    print("TestParallelZoneReports = Failed")
+                    return
+                jobs.append((f"test_zone{zone}_data.txt", f"test_zone{zone}_report.txt"))
+            jobs.append(("nonexistent_zone_data.txt", "test_zone_missing_report.txt"))
+
+            # Test every zone is reported and a missing source is flagged
+            if check_function_exists(self.module_obj, "generate_batch_reports"):
+                result = safely_call_function(self.module_obj, "generate_batch_reports", jobs, "test_fleet_report.txt", 2)
+                if result is None or not isinstance(result, dict):
+                    self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                    print("TestParallelZoneReports = Failed")
+                    return
+                for zone in range(3):
+                    if result.get(f"test_zone{zone}_report.txt") is not True or not os.path.exists(f"test_zone{zone}_report.txt"):
+                        self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                        print("TestParallelZoneReports = Failed")
+                        return
+                if result.get("test_zone_missing_report.txt") is not False:
+                    self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                    print("TestParallelZoneReports = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                print("TestParallelZoneReports = Failed")
+                return
+
+            # Test the worker entry point returns the zone aggregate
+            if check_function_exists(self.module_obj, "generate_zone_report"):
+                stats = safely_call_function(self.module_obj, "generate_zone_report", "test_zone0_data.txt", "test_zone0_report.txt")
+                if stats is None or not isinstance(stats, dict) or stats.get("count") != 7:
+                    self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                    print("TestParallelZoneReports = Failed")
+                    return
+                if safely_call_function(self.module_obj, "generate_zone_report", "nonexistent_zone_data.txt", "test_zone_missing_report.txt") is not None:
+                    self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                    print("TestParallelZoneReports = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                print("TestParallelZoneReports = Failed")
+                return
+
+            # Test the fleet summary averages every zone's readings
+            try:
+                with open("test_fleet_report.txt", "r") as f:
+                    content = f.read()
+            except Exception:
+                self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                print("TestParallelZoneReports = Failed")
+                return
+            temp_match = re.search(r"Temperature:\s*([\d.]+)", content)
+            if temp_match is None or abs(float(temp_match.group(1)) - sum(all_temperatures) / len(all_temperatures)) > 0.01:
+                self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+                print("TestParallelZoneReports = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_zone0_data.txt", "test_zone0_report.txt", "test_zone1_data.txt", "test_zone1_report.txt", "test_zone2_data.txt", "test_zone2_report.txt", "test_zone_missing_report.txt", "test_fleet_report.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestParallelZoneReports", True, "functional")
+            print("TestParallelZoneReports = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_zone0_data.txt", "test_zone0_report.txt", "test_zone1_data.txt", "test_zone1_report.txt", "test_zone2_data.txt", "test_zone2_report.txt", "test_zone_missing_report.txt", "test_fleet_report.txt"])
+            self.test_obj.yakshaAssert("TestParallelZoneReports", False, "functional")
+            print("TestParallelZoneReports = Failed")
+
+    def test_multi_format_report_outputs(self):
+        """Test text, JSON, CSV and HTML reports from one aggregation pass"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+
+            readings = [
+                {"date": "2023-06-01", "temperature": 24.0, "humidity": 60.0, "ph_level": 6.0, "light_level": 20000},
+                {"date": "2023-06-02", "temperature": 26.0, "humidity": 70.0, "ph_level": 6.2, "light_level": 22000},
+                {"date": "2023-06-03", "temperature": 25.0, "humidity": 65.0, "ph_level": 6.1, "light_level": 21000}
+            ]
+            if safely_call_function(self.module_obj, "save_daily_readings", readings, "test_format_data.txt") is not True:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+
+            # Test all formats from one call
+            outputs = {"text": "test_format_report.txt", "json": "test_format_report.json", "csv": "test_format_report.csv", "html": "test_format_report.html"}
+            if check_function_exists(self.module_obj, "generate_report_outputs"):
+                if safely_call_function(self.module_obj, "generate_report_outputs", "test_format_data.txt", outputs) is not True:
+                    self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                    print("TestMultiFormatReportOutputs = Failed")
+                    return
+            else:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+            try:
+                with open("test_format_report.txt", "r") as f:
+                    text_content = f.read()
+                with open("test_format_report.json", "r") as f:
+                    json_content = json.load(f)
+                with open("test_format_report.csv", "r", newline="") as f:
+                    csv_rows = list(csv.reader(f))
+                with open("test_format_report.html", "r") as f:
+                    html_content = f.read()
+            except Exception:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+            if "WEEKLY HYDROPONIC MONITORING REPORT" not in text_content or "DAILY READINGS:" not in text_content:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+            elif abs(json_content.get("averages", {}).get("temperature", 0) - 25.0) > 0.01 or len(json_content.get("daily_readings", [])) != 3:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+            elif not any("2023-06-03" in row for row in csv_rows) or "<table" not in html_content or "2023-06-02" not in html_content:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+
+            # Test several renderers consume one aggregate
+            if check_function_exists(self.module_obj, "render_report"):
+                stats = safely_call_function(self.module_obj, "new_report_stats")
+                for reading in readings:
+                    stats = safely_call_function(self.module_obj, "update_report_stats", stats, reading)
+                for fmt, path in [("json", "test_render_report.json"), ("text", "test_render_report.txt")]:
+                    if safely_call_function(self.module_obj, "render_report", stats, path, fmt, iter(readings)) is not True:
+                        self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                        print("TestMultiFormatReportOutputs = Failed")
+                        return
+                with open("test_render_report.json", "r") as f:
+                    if abs(json.load(f).get("averages", {}).get("humidity", 0) - 65.0) > 0.01:
+                        self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                        print("TestMultiFormatReportOutputs = Failed")
+                        return
+            else:
+                self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+                print("TestMultiFormatReportOutputs = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_format_data.txt", "test_format_report.txt", "test_format_report.json", "test_format_report.csv", "test_format_report.html", "test_render_report.json", "test_render_report.txt"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", True, "functional")
+            print("TestMultiFormatReportOutputs = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_format_data.txt", "test_format_report.txt", "test_format_report.json", "test_format_report.csv", "test_format_report.html", "test_render_report.json", "test_render_report.txt"])
+            self.test_obj.yakshaAssert("TestMultiFormatReportOutputs", False, "functional")
+            print("TestMultiFormatReportOutputs = Failed")
+
+    def test_binary_backup_preserves_bytes(self):
+        """Test backups are byte-for-byte copies across chunk boundaries"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+                print("TestBinaryBackupPreservesBytes = Failed")
+                return
+
+            # Create a source with CRLF/LF newlines, non-UTF-8 bytes and several chunks of data
+            content = b"2023-06-01,24.5,65.2,6.2,22000\r\n2023-06-02,25.1,63.7,6.3,21800\n" + bytes(range(256)) * 4096 + b"\xff\xfe tail without newline"
+            try:
+                with open("test_binary_source.dat", "wb") as f:
+                    f.write(content)
+            except Exception:
+                self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+                print("TestBinaryBackupPreservesBytes = Failed")
+                return
+
+            # Test the default path, the chunked fallback with kernel copies failing, and a
+            # small chunk size that forces many iterations
+            def failing_copy(*args, **kwargs):
+                raise OSError("kernel copy unavailable")
+
+            for chunk_size, force_fallback in [(None, False), (4096, True), (1, True)]:
+                args = ("test_binary_source.dat", "test_binary_backup.dat") if chunk_size is None else ("test_binary_source.dat", "test_binary_backup.dat", chunk_size)
+                if chunk_size == 1:
+                    content = content[:10000]
+                    with open("test_binary_source.dat", "wb") as f:
+                        f.write(content)
+                if force_fallback:
+                    with mock.patch("os.copy_file_range", failing_copy, create=True), mock.patch("os.sendfile", failing_copy, create=True):
+                        result = safely_call_function(self.module_obj, "backup_data_files", *args)
+                else:
+                    result = safely_call_function(self.module_obj, "backup_data_files", *args)
+                if result is None or result is not True:
+                    self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+                    print("TestBinaryBackupPreservesBytes = Failed")
+                    return
+                try:
+                    with open("test_binary_backup.dat", "rb") as f:
+                        if f.read() != content:
+                            self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+                            print("TestBinaryBackupPreservesBytes = Failed")
+                            return
+                except Exception:
+                    self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+                    print("TestBinaryBackupPreservesBytes = Failed")
+                    return
+
+            # Test an empty source produces an empty backup
+            with open("test_binary_source.dat", "wb") as f:
+                pass
+            if safely_call_function(self.module_obj, "backup_data_files", "test_binary_source.dat", "test_binary_backup.dat") is not True:
+                self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+                print("TestBinaryBackupPreservesBytes = Failed")
+                return
+            if os.path.getsize("test_binary_backup.dat") != 0:
+                self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+                print("TestBinaryBackupPreservesBytes = Failed")
+                return
+
+            # Clean up test files
+            cleanup_test_files(["test_binary_source.dat", "test_binary_backup.dat"])
+
+            # All tests passed
+            self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", True, "functional")
+            print("TestBinaryBackupPreservesBytes = Passed")
+
+        except Exception:
+            cleanup_test_files(["test_binary_source.dat", "test_binary_backup.dat"])
+            self.test_obj.yakshaAssert("TestBinaryBackupPreservesBytes", False, "functional")
+            print("TestBinaryBackupPreservesBytes = Failed")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file